@@ -4,12 +4,20 @@ MCP-over-HTTP Bridge: Allows remote MCP clients to connect via HTTP
 This enables hosting MCP servers in the cloud for multiple clients
 """
 
-from fastapi import FastAPI, WebSocket, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-import json
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Depends, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from contextlib import asynccontextmanager
+from pydantic import BaseModel, ConfigDict, ValidationError
+from simple_salesforce.exceptions import SalesforceError
+import itertools
+import anyio
+import hashlib
+import orjson
 import asyncio
 import os
-from typing import Dict, Any
+import socket
+from typing import Dict, Any, Optional, Union
 import uuid
 
 # Import your existing MCP components  
@@ -17,82 +25,168 @@ from salesforcemcp import sfdc_client
 from salesforcemcp import definitions as sfmcpdef
 from salesforcemcp import implementations as sfmcpimpl
 
+# Maximum concurrently processed requests per WebSocket connection
+WS_MAX_IN_FLIGHT = 32
+
+# Tool name -> implementation used by tools/call
+TOOL_IMPLS = {
+    "create_object": sfmcpimpl.create_object_impl,
+    "create_object_with_fields": sfmcpimpl.create_object_with_fields_impl,
+    "create_objects_bulk": sfmcpimpl.create_objects_bulk_impl,
+    "poll_deploy_status": sfmcpimpl.poll_deploy_status_impl,
+    "run_soql_query": sfmcpimpl.run_soql_query_impl,
+    "run_sosl_search": sfmcpimpl.run_sosl_search_impl,
+    "get_object_fields": sfmcpimpl.get_object_fields_impl,
+    "describe_object": sfmcpimpl.describe_object_impl,
+    "create_einstein_model": sfmcpimpl.create_einstein_model_impl,
+}
+
+# Static responses, shared by every request
+_INIT_RESULT = {
+    "protocolVersion": "2024-11-05",
+    "serverInfo": {
+        "name": "salesforce-mcp-bridge",
+        "version": "1.0.0"
+    },
+    "capabilities": {
+        "tools": {}
+    }
+}
+
+_ROOT_INFO = {
+    "service": "MCP Bridge Server",
+    "version": "1.0.0",
+    "protocols": ["http", "websocket"],
+    "mcp_version": "2024-11-05",
+    "endpoints": {
+        "mcp_http": "/mcp",
+        "mcp_ws": "/mcp/ws",
+        "tools": "/mcp/tools",
+        "soql_stream": "/mcp/soql"
+    }
+}
+
+# Tool definitions never change while the process runs, so serialize them once
+_TOOLS_LIST_PREFIX = b'{"jsonrpc":"2.0","id":'
+_TOOLS_LIST_SUFFIX = b',"result":{"tools":' + sfmcpdef.get_tools_json() + b"}}"
+_TOOLS_JSON = b'{"tools":' + sfmcpdef.get_tools_json("schema") + b"}"
+_TOOLS_ETAG = f'"{hashlib.blake2b(_TOOLS_JSON, digest_size=8).hexdigest()}"'
+_TOOLS_HEADERS = {"ETag": _TOOLS_ETAG, "Cache-Control": "public, max-age=3600"}
+
+# Salesforce client of this worker process, connected on first use
+_sf_client = sfdc_client.OrgHandler()
+
+async def get_sf_client() -> sfdc_client.OrgHandler:
+    """Returns the worker's Salesforce client once its shared, backed-off login attempt settles"""
+    if not await _sf_client.ensure_connection():
+        print("Warning: Failed to establish Salesforce connection")
+    return _sf_client
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Configure the worker once it has started"""
+    # Tool calls block on Salesforce I/O in the threadpool; allow more of them in flight
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 200
+    yield
+    _sf_client.close()
+
 app = FastAPI(
     title="MCP Bridge Server",
     description="HTTP/WebSocket bridge for Model Context Protocol",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    docs_url=None,
+    redoc_url=None
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"], 
-    allow_headers=["*"],
-)
+_CORS_HEADER = (b"access-control-allow-origin", b"*")
+_CACHE_HEADER = (b"cache-control", b"public, max-age=3600")
+_CACHEABLE_PATHS = {"/", "/mcp/tools"}
+_PREFLIGHT_HEADERS = [
+    _CORS_HEADER,
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"600"),
+    (b"content-length", b"2"),
+    (b"content-type", b"text/plain; charset=utf-8"),
+]
+
+class StaticCORSMiddleware:
+    """Adds a fixed allow-all CORS header, plus Cache-Control on static GET routes."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-# Initialize Salesforce client
-sf_client = sfdc_client.OrgHandler()
-if not sf_client.establish_connection():
-    print("Warning: Failed to establish Salesforce connection")
+        method = scope["method"]
+        if method == "OPTIONS":
+            request_headers = dict(scope["headers"])
+            if b"access-control-request-method" in request_headers:
+                headers = list(_PREFLIGHT_HEADERS)
+                requested = request_headers.get(b"access-control-request-headers")
+                if requested:
+                    headers.append((b"access-control-allow-headers", requested))
+                await send({"type": "http.response.start", "status": 200, "headers": headers})
+                await send({"type": "http.response.body", "body": b"OK"})
+                return
+
+        cacheable = method == "GET" and scope["path"] in _CACHEABLE_PATHS
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = message.setdefault("headers", [])
+                headers.append(_CORS_HEADER)
+                if cacheable and not any(name == b"cache-control" for name, _ in headers):
+                    headers.append(_CACHE_HEADER)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+app.add_middleware(StaticCORSMiddleware)
 
 @app.get("/")
 async def root():
+    return _ROOT_INFO
+
+class JsonRpcRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    jsonrpc: str
+    method: str
+    params: Dict[str, Any] = {}
+    id: Optional[Union[int, str]] = None
+
+def _error_response(request_id: Any, message: str, code: int = -32000) -> Dict[str, Any]:
     return {
-        "service": "MCP Bridge Server",
-        "version": "1.0.0",
-        "protocols": ["http", "websocket"],
-        "mcp_version": "2024-11-05",
-        "endpoints": {
-            "mcp_http": "/mcp",
-            "mcp_ws": "/mcp/ws",
-            "tools": "/mcp/tools"
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {
+            "code": code,
+            "message": message
         }
     }
 
-@app.post("/mcp")
-async def mcp_http(request: Dict[str, Any]):
-    """HTTP endpoint that accepts MCP JSON-RPC requests"""
+async def _dispatch_mcp(request: JsonRpcRequest) -> Dict[str, Any]:
+    """Processes one MCP JSON-RPC request into its response object"""
+    request_id = request.id
     try:
         # Validate MCP request format
-        if not request.get("jsonrpc") == "2.0":
-            raise HTTPException(status_code=400, detail="Invalid JSON-RPC version")
+        if request.jsonrpc != "2.0":
+            return _error_response(request_id, "Invalid JSON-RPC version")
         
-        method = request.get("method")
-        params = request.get("params", {})
-        request_id = request.get("id")
+        method = request.method
+        params = request.params
         
         # Handle MCP methods
         if method == "initialize":
             return {
                 "jsonrpc": "2.0", 
                 "id": request_id,
-                "result": {
-                    "protocolVersion": "2024-11-05",
-                    "serverInfo": {
-                        "name": "salesforce-mcp-bridge",
-                        "version": "1.0.0"
-                    },
-                    "capabilities": {
-                        "tools": {}
-                    }
-                }
-            }
-            
-        elif method == "tools/list":
-            tools = sfmcpdef.get_tools()
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id, 
-                "result": {
-                    "tools": [
-                        {
-                            "name": tool.name,
-                            "description": tool.description,
-                            "inputSchema": tool.inputSchema
-                        } for tool in tools
-                    ]
-                }
+                "result": _INIT_RESULT
             }
             
         elif method == "tools/call":
@@ -100,22 +194,11 @@ async def mcp_http(request: Dict[str, Any]):
             arguments = params.get("arguments", {})
             
             # Call the appropriate implementation
-            if tool_name == "create_object":
-                result = sfmcpimpl.create_object_impl(sf_client, arguments)
-            elif tool_name == "create_object_with_fields":
-                result = sfmcpimpl.create_object_with_fields_impl(sf_client, arguments)
-            elif tool_name == "run_soql_query":
-                result = sfmcpimpl.run_soql_query_impl(sf_client, arguments)
-            elif tool_name == "run_sosl_search":
-                result = sfmcpimpl.run_sosl_search_impl(sf_client, arguments)
-            elif tool_name == "get_object_fields":
-                result = sfmcpimpl.get_object_fields_impl(sf_client, arguments)
-            elif tool_name == "describe_object":
-                result = sfmcpimpl.describe_object_impl(sf_client, arguments)
-            elif tool_name == "create_einstein_model":
-                result = sfmcpimpl.create_einstein_model_impl(sf_client, arguments)
-            else:
-                raise HTTPException(status_code=400, detail=f"Unknown tool: {tool_name}")
+            impl = TOOL_IMPLS.get(tool_name)
+            if impl is None:
+                return _error_response(request_id, f"Unknown tool: {tool_name}")
+            sf_client = await get_sf_client()
+            result = await run_in_threadpool(impl, sf_client, arguments)
             
             return {
                 "jsonrpc": "2.0",
@@ -125,53 +208,117 @@ async def mcp_http(request: Dict[str, Any]):
                 }
             }
         else:
-            raise HTTPException(status_code=400, detail=f"Unknown method: {method}")
+            return _error_response(request_id, f"Unknown method: {method}")
             
     except Exception as e:
-        return {
-            "jsonrpc": "2.0",
-            "id": request.get("id"),
-            "error": {
-                "code": -32000,
-                "message": str(e)
-            }
-        }
+        return _error_response(request_id, str(e))
+
+async def _handle_mcp(request: JsonRpcRequest) -> bytes:
+    """Processes one MCP JSON-RPC request into serialized JSON; shared by the HTTP and WebSocket endpoints"""
+    # tools/list only varies by id, so splice it into the pre-serialized response
+    if request.method == "tools/list" and request.jsonrpc == "2.0":
+        return _TOOLS_LIST_PREFIX + orjson.dumps(request.id) + _TOOLS_LIST_SUFFIX
+    return orjson.dumps(await _dispatch_mcp(request))
+
+@app.post("/mcp")
+async def mcp_http(request: JsonRpcRequest):
+    """HTTP endpoint that accepts MCP JSON-RPC requests"""
+    return Response(content=await _handle_mcp(request), media_type="application/json")
+
+async def _handle_frame(data: str) -> bytes:
+    """Processes one WebSocket frame; a malformed frame gets a JSON-RPC error response"""
+    try:
+        request = JsonRpcRequest.model_validate_json(data)
+    except ValidationError as e:
+        parse_error = any(error["type"] == "json_invalid" for error in e.errors())
+        return orjson.dumps(_error_response(None, str(e), code=-32700 if parse_error else -32600))
+    return await _handle_mcp(request)
 
 @app.websocket("/mcp/ws") 
 async def mcp_websocket(websocket: WebSocket):
     """WebSocket endpoint for real-time MCP communication"""
     await websocket.accept()
-    
+
+    # Frames are handled concurrently; clients match responses to requests by id
+    in_flight = asyncio.Semaphore(WS_MAX_IN_FLIGHT)
+    send_lock = asyncio.Lock()
+    pending: set[asyncio.Task] = set()
+
+    async def handle_and_send(data: str):
+        async with in_flight:
+            response = await _handle_frame(data)
+        async with send_lock:
+            try:
+                await websocket.send_text(response.decode())
+            except (WebSocketDisconnect, RuntimeError):
+                # The client went away while this frame was being handled
+                pass
+
     try:
-        while True:
-            # Receive MCP request
-            data = await websocket.receive_text()
-            request = json.loads(data)
-            
-            # Process same as HTTP endpoint
-            response = await mcp_http(request)
-            
-            # Send response
-            await websocket.send_text(json.dumps(response))
-            
-    except Exception as e:
-        await websocket.close(code=1000)
+        async for data in websocket.iter_text():
+            task = asyncio.create_task(handle_and_send(data))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+    finally:
+        # Nobody is left to read the responses once the receive loop ends
+        tasks = list(pending)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
 @app.get("/mcp/tools")
-async def list_tools():
+async def list_tools(request: Request):
     """List available MCP tools in a simple format"""
-    tools = sfmcpdef.get_tools()
-    return {
-        "tools": [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "schema": tool.inputSchema
-            } for tool in tools
-        ]
-    }
+    if request.headers.get("if-none-match") == _TOOLS_ETAG:
+        return Response(status_code=304, headers=_TOOLS_HEADERS)
+    return Response(content=_TOOLS_JSON, media_type="application/json", headers=_TOOLS_HEADERS)
 
-if __name__ == "__main__":
+@app.get("/mcp/soql")
+async def stream_soql(query: str, sf_client: sfdc_client.OrgHandler = Depends(get_sf_client)):
+    """Stream SOQL query results as newline-delimited JSON records"""
+    if not sf_client.connection:
+        raise HTTPException(status_code=503, detail="Salesforce connection not established.")
+
+    records = sfmcpimpl.iter_soql_ndjson(sf_client, query)
+    # Pull the first record before responding so query errors still map to an HTTP status
+    try:
+        first = await run_in_threadpool(next, records, None)
+    except SalesforceError as e:
+        raise HTTPException(status_code=400, detail=f"SOQL Error: {e.status} {e.resource_name} {e.content}")
+    if first is None:
+        return StreamingResponse(iter(()), media_type="application/x-ndjson")
+    return StreamingResponse(itertools.chain((first,), records), media_type="application/x-ndjson")
+
+def _serve(sock: socket.socket):
+    """Runs one uvicorn worker on the listening socket shared by the parent"""
     import uvicorn
+    # uvloop + httptools come with uvicorn[standard]; MCP clients hold connections
+    # open between calls, so keep them alive longer and skip per-request access logs
+    config = uvicorn.Config(
+        app,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        timeout_keep_alive=30,
+        access_log=False,
+        log_level="warning",
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+if __name__ == "__main__":
+    import multiprocessing
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+
+    # Bind once in the parent so every worker accepts on the same socket
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("0.0.0.0", port))
+    sock.listen(2048)
+    os.set_inheritable(sock.fileno(), True)
+
+    processes = [multiprocessing.Process(target=_serve, args=(sock,)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
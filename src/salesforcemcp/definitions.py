@@ -1,4 +1,7 @@
+from functools import lru_cache
+
 import mcp.types as types
+import orjson
 
 createObjectSchema = {
     "type": "object",
@@ -49,209 +52,295 @@ createObjectSchema = {
     "required": ["name", "plural_name", "api_name", "description", "fields"],
 }
 
-def get_tools():
-    tools = [
-        # Object Creation Tools
-        types.Tool(
-            name="create_object",
-            description="Create a new object in salesforce",
-            inputSchema={
+forceDeployProperty = {
+    "type": "boolean",
+    "description": "Deploy even if the package is identical to the last successful or running deployment",
+    "default": False,
+}
+
+# create_object_with_fields also accepts force; bulk creation always deploys
+createObjectWithFieldsSchema = {
+    **createObjectSchema,
+    "properties": {**createObjectSchema["properties"], "force": forceDeployProperty},
+}
+
+createObjectBasicSchema = {
+    "type": "object",
+    "properties": {
+        "name": {
+            "type": "string",
+            "description": "The name of the object to be created",
+        },
+        "plural_name": {
+            "type": "string",
+            "description": "The plural name of the object to be created",
+        },
+        "description": {
+            "type": "string",
+            "description": "The general description of the object purpose in a short sentence",
+        },
+        "api_name": {
+            "type": "string",
+            "description": "The api name of the object to be created finished with __c",
+        },
+    },
+    "required": ["name", "plural_name", "api_name"], 
+}
+
+createObjectsBulkSchema = {
+    "type": "object",
+    "properties": {
+        "objects": {
+            "type": "array",
+            "description": "The objects to create; each entry takes the same fields as create_object_with_fields",
+            "items": createObjectSchema,
+        },
+    },
+    "required": ["objects"],
+}
+
+pollDeployStatusSchema = {
+    "type": "object",
+    "properties": {
+        "job_id": {
+            "type": "string",
+            "description": "The deployment job ID returned by create_object_with_fields or create_einstein_model",
+        },
+    },
+    "required": ["job_id"],
+}
+
+runSoqlQuerySchema = {
+    "type": "object",
+    "properties": {
+        "query": {
+            "type": "string",
+            "description": "The SOQL query to execute (e.g., SELECT Id, Name FROM Account LIMIT 10)",
+            "examples": [
+                "SELECT Id, Name FROM Account LIMIT 10",
+                "SELECT Name, Amount FROM Opportunity WHERE CloseDate = THIS_YEAR ORDER BY Amount DESC NULLS LAST",
+                "SELECT Subject, Status, Priority FROM Case WHERE IsClosed = false",
+                "SELECT COUNT(Id) FROM Contact WHERE AccountId = '001...'"
+            ]
+        },
+    },
+    "required": ["query"]
+}
+
+runSoslSearchSchema = {
+    "type": "object",
+    "properties": {
+        "search": {
+            "type": "string",
+            "description": "The SOSL search string (e.g., 'FIND {MyCompany} IN ALL FIELDS RETURNING Account(Id, Name)')",
+            "examples": [
+                "FIND {Acme} IN NAME FIELDS RETURNING Account(Name), Contact(FirstName, LastName)",
+                "FIND {support@example.com} IN EMAIL FIELDS RETURNING Contact(Name, Email)",
+                "FIND {SF*} IN ALL FIELDS LIMIT 20"
+            ]
+        },
+    },
+    "required": ["search"]
+}
+
+getObjectFieldsSchema = {
+    "type": "object",
+    "properties": {
+        "object_name": {
+            "type": "string",
+            "description": "The API name of the Salesforce object (e.g., 'Account', 'Contact', 'MyCustomObject__c')",
+            "examples": [
+                "Account",
+                "Opportunity", 
+                "Lead",
+                "My_Custom_Object__c"
+            ]
+        },
+    },
+    "required": ["object_name"]
+}
+
+describeObjectSchema = {
+    "type": "object",
+    "properties": {
+        "object_name": {
+            "type": "string",
+            "description": "API name of the object (e.g., 'Account', 'Custom_Object__c')",
+        },
+        "include_field_details": {
+            "type": "boolean",
+            "description": "Whether to include detailed field information (default: true)",
+            "default": True,
+        },
+    },
+    "required": ["object_name"],
+}
+
+createEinsteinModelSchema = {
+    "type": "object",
+    "properties": {
+        "model_name": {
+            "type": "string",
+            "description": "The name/label of the Einstein Studio model",
+        },
+        "description": {
+            "type": "string",
+            "description": "Description of what the model predicts or analyzes",
+        },
+        "model_capability": {
+            "type": "string",
+            "description": "The capability of the model",
+            "enum": ["BinaryClassification", "Regression", "MultiClassification"],
+            "default": "BinaryClassification"
+        },
+        "outcome_field": {
+            "type": "string",
+            "description": "The field name that represents the outcome/target variable (e.g., 'Converted__c')",
+        },
+        "goal": {
+            "type": "string", 
+            "description": "The goal for the outcome",
+            "enum": ["Maximize", "Minimize"],
+            "default": "Maximize"
+        },
+        "data_source": {
+            "type": "string",
+            "description": "The name of the data model object to use as training data (e.g., 'Lead_Model_Training__dlm')",
+        },
+        "success_value": {
+            "type": "string",
+            "description": "The value that represents success for binary classification (e.g., 'true')",
+            "default": "true"
+        },
+        "failure_value": {
+            "type": "string", 
+            "description": "The value that represents failure for binary classification (e.g., 'false')",
+            "default": "false"
+        },
+        "algorithm_type": {
+            "type": "string",
+            "description": "The algorithm to use for the model",
+            "enum": ["XGBoost", "LinearRegression", "LogisticRegression"],
+            "default": "XGBoost"
+        },
+        "fields": {
+            "type": "array",
+            "description": "The fields to include in the model for prediction",
+            "items": {
                 "type": "object",
                 "properties": {
-                    "name": {
+                    "field_name": {
                         "type": "string",
-                        "description": "The name of the object to be created",
+                        "description": "The API name of the field",
                     },
-                    "plural_name": {
+                    "field_label": {
                         "type": "string",
-                        "description": "The plural name of the object to be created",
+                        "description": "The display label of the field",
                     },
-                    "description": {
+                    "field_type": {
                         "type": "string",
-                        "description": "The general description of the object purpose in a short sentence",
+                        "enum": ["Text", "Number"],
+                        "description": "The type of the field",
                     },
-                    "api_name": {
-                        "type": "string",
-                        "description": "The api name of the object to be created finished with __c",
+                    "data_type": {
+                        "type": "string", 
+                        "enum": ["Categorical", "Numerical"],
+                        "description": "How the field should be treated in the model",
                     },
+                    "ignored": {
+                        "type": "boolean",
+                        "description": "Whether to ignore this field in the model",
+                        "default": False
+                    }
                 },
-                "required": ["name", "plural_name", "api_name"], 
-            },
+                "required": ["field_name", "field_label", "field_type", "data_type"]
+            }
+        },
+        "force": forceDeployProperty,
+    },
+    "required": ["model_name", "description", "outcome_field", "data_source", "fields"]
+}
+
+toolSchemas = {
+    "create_object": createObjectBasicSchema,
+    "create_object_with_fields": createObjectWithFieldsSchema,
+    "create_objects_bulk": createObjectsBulkSchema,
+    "poll_deploy_status": pollDeployStatusSchema,
+    "run_soql_query": runSoqlQuerySchema,
+    "run_sosl_search": runSoslSearchSchema,
+    "get_object_fields": getObjectFieldsSchema,
+    "describe_object": describeObjectSchema,
+    "create_einstein_model": createEinsteinModelSchema,
+}
+
+# Schemas serialized once so HTTP listings can be assembled from bytes
+_TOOL_SCHEMAS_JSON = {name: orjson.dumps(schema) for name, schema in toolSchemas.items()}
+
+@lru_cache(maxsize=1)
+def get_tools() -> tuple[types.Tool, ...]:
+    """Builds the tool definitions once per process; callers must not mutate them."""
+    tools = (
+        # Object Creation Tools
+        types.Tool(
+            name="create_object",
+            description="Create a new object in salesforce",
+            inputSchema=createObjectBasicSchema,
         ),
         types.Tool(
             name="create_object_with_fields",
             description="Create a new object in salesforce with custom fields",
-            inputSchema=createObjectSchema,
+            inputSchema=createObjectWithFieldsSchema,
+        ),
+        types.Tool(
+            name="create_objects_bulk",
+            description="Create several new objects in salesforce with custom fields, deploying them in parallel",
+            inputSchema=createObjectsBulkSchema,
+        ),
+        types.Tool(
+            name="poll_deploy_status",
+            description="Check the progress of a metadata deployment started by an object or model creation tool",
+            inputSchema=pollDeployStatusSchema,
         ),
         
         # Data Query Tools
         types.Tool(
             name="run_soql_query",
             description="Executes a SOQL query against Salesforce",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "The SOQL query to execute (e.g., SELECT Id, Name FROM Account LIMIT 10)",
-                        "examples": [
-                            "SELECT Id, Name FROM Account LIMIT 10",
-                            "SELECT Name, Amount FROM Opportunity WHERE CloseDate = THIS_YEAR ORDER BY Amount DESC NULLS LAST",
-                            "SELECT Subject, Status, Priority FROM Case WHERE IsClosed = false",
-                            "SELECT COUNT(Id) FROM Contact WHERE AccountId = '001...'"
-                        ]
-                    },
-                },
-                "required": ["query"]
-            }
+            inputSchema=runSoqlQuerySchema
         ),
         types.Tool(
             name="run_sosl_search",
             description="Executes a SOSL search against Salesforce",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "search": {
-                        "type": "string",
-                        "description": "The SOSL search string (e.g., 'FIND {MyCompany} IN ALL FIELDS RETURNING Account(Id, Name)')",
-                        "examples": [
-                            "FIND {Acme} IN NAME FIELDS RETURNING Account(Name), Contact(FirstName, LastName)",
-                            "FIND {support@example.com} IN EMAIL FIELDS RETURNING Contact(Name, Email)",
-                            "FIND {SF*} IN ALL FIELDS LIMIT 20"
-                        ]
-                    },
-                },
-                "required": ["search"]
-            }
+            inputSchema=runSoslSearchSchema
         ),
         types.Tool(
             name="get_object_fields",
             description="Retrieves detailed information about the fields of a specific Salesforce object",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "The API name of the Salesforce object (e.g., 'Account', 'Contact', 'MyCustomObject__c')",
-                        "examples": [
-                            "Account",
-                            "Opportunity", 
-                            "Lead",
-                            "My_Custom_Object__c"
-                        ]
-                    },
-                },
-                "required": ["object_name"]
-            }
+            inputSchema=getObjectFieldsSchema
         ),
         types.Tool(
             name="describe_object",
             description="Get detailed schema information for a Salesforce object, including fields, relationships, and picklist values",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "object_name": {
-                        "type": "string",
-                        "description": "API name of the object (e.g., 'Account', 'Custom_Object__c')",
-                    },
-                    "include_field_details": {
-                        "type": "boolean",
-                        "description": "Whether to include detailed field information (default: true)",
-                        "default": True,
-                    },
-                },
-                "required": ["object_name"],
-            },
+            inputSchema=describeObjectSchema,
         ),
         
         # Einstein Studio Model Tools
         types.Tool(
             name="create_einstein_model",
             description="Create an Einstein Studio model using AppFrameworkTemplateBundle",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "model_name": {
-                        "type": "string",
-                        "description": "The name/label of the Einstein Studio model",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Description of what the model predicts or analyzes",
-                    },
-                    "model_capability": {
-                        "type": "string",
-                        "description": "The capability of the model",
-                        "enum": ["BinaryClassification", "Regression", "MultiClassification"],
-                        "default": "BinaryClassification"
-                    },
-                    "outcome_field": {
-                        "type": "string",
-                        "description": "The field name that represents the outcome/target variable (e.g., 'Converted__c')",
-                    },
-                    "goal": {
-                        "type": "string", 
-                        "description": "The goal for the outcome",
-                        "enum": ["Maximize", "Minimize"],
-                        "default": "Maximize"
-                    },
-                    "data_source": {
-                        "type": "string",
-                        "description": "The name of the data model object to use as training data (e.g., 'Lead_Model_Training__dlm')",
-                    },
-                    "success_value": {
-                        "type": "string",
-                        "description": "The value that represents success for binary classification (e.g., 'true')",
-                        "default": "true"
-                    },
-                    "failure_value": {
-                        "type": "string", 
-                        "description": "The value that represents failure for binary classification (e.g., 'false')",
-                        "default": "false"
-                    },
-                    "algorithm_type": {
-                        "type": "string",
-                        "description": "The algorithm to use for the model",
-                        "enum": ["XGBoost", "LinearRegression", "LogisticRegression"],
-                        "default": "XGBoost"
-                    },
-                    "fields": {
-                        "type": "array",
-                        "description": "The fields to include in the model for prediction",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "field_name": {
-                                    "type": "string",
-                                    "description": "The API name of the field",
-                                },
-                                "field_label": {
-                                    "type": "string",
-                                    "description": "The display label of the field",
-                                },
-                                "field_type": {
-                                    "type": "string",
-                                    "enum": ["Text", "Number"],
-                                    "description": "The type of the field",
-                                },
-                                "data_type": {
-                                    "type": "string", 
-                                    "enum": ["Categorical", "Numerical"],
-                                    "description": "How the field should be treated in the model",
-                                },
-                                "ignored": {
-                                    "type": "boolean",
-                                    "description": "Whether to ignore this field in the model",
-                                    "default": False
-                                }
-                            },
-                            "required": ["field_name", "field_label", "field_type", "data_type"]
-                        }
-                    }
-                },
-                "required": ["model_name", "description", "outcome_field", "data_source", "fields"]
-            },
+            inputSchema=createEinsteinModelSchema,
         ),
-    ]
+    )
     
-    return tools
\ No newline at end of file
+    return tools
+
+@lru_cache(maxsize=None)
+def get_tools_json(schema_key: str = "inputSchema") -> bytes:
+    """Returns the tool list as a JSON array, with each schema stored under schema_key."""
+    key = b"," + orjson.dumps(schema_key) + b":"
+    return b"[" + b",".join(
+        b'{"name":' + orjson.dumps(tool.name)
+        + b',"description":' + orjson.dumps(tool.description)
+        + key + _TOOL_SCHEMAS_JSON[tool.name] + b"}"
+        for tool in get_tools()
+    ) + b"]"
@@ -3,10 +3,134 @@ from salesforcemcp.sfdc_client import OrgHandler
 import mcp.types as types
 from simple_salesforce import Salesforce
 from simple_salesforce.exceptions import SalesforceError
-import json
-from typing import Any
+import orjson
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
+from typing import Any, Callable, Iterator
 
-def create_object_impl(sf_client: sfdc_client.OrgHandler, arguments: dict[str, str]):
+# Package builders share on-disk staging directories, so deployments are serialized
+_deploy_lock = threading.Lock()
+
+# Rendered describe results; object schemas rarely change within a few minutes
+_describe_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+_describe_cache_lock = threading.Lock()
+
+def _get_cached_describe(key: tuple) -> list[types.TextContent] | None:
+    with _describe_cache_lock:
+        return _describe_cache.get(key)
+
+def _set_cached_describe(key: tuple, content: list[types.TextContent]) -> None:
+    with _describe_cache_lock:
+        _describe_cache[key] = content
+
+# One lock per cache key, so a burst of identical describes makes a single Salesforce call
+_describe_flight_locks: dict[tuple, threading.Lock] = {}
+
+def _cached_describe(key: tuple, build) -> list[types.TextContent]:
+    """Returns the cached describe for key, calling build() at most once per miss."""
+    cached = _get_cached_describe(key)
+    if cached is not None:
+        return cached
+    with _describe_flight_locks.setdefault(key, threading.Lock()):
+        cached = _get_cached_describe(key)
+        if cached is not None:
+            return cached
+        try:
+            return build()
+        finally:
+            # Waiters on this lock read the cache; the next miss after expiry gets a new lock
+            _describe_flight_locks.pop(key, None)
+
+def _invalidate_describe(sf_client: OrgHandler, object_name: str) -> None:
+    """Drops every cached describe of an object whose metadata was just deployed."""
+    with _describe_cache_lock:
+        for key in (("get_object_fields", object_name),
+                    ("describe_object", object_name, True),
+                    ("describe_object", object_name, False)):
+            _describe_cache.pop(key, None)
+    sf_client.invalidate(object_name)
+
+# Deployments whose objects were already invalidated, so repeated polls keep the fresh cache
+_invalidated_jobs: TTLCache = TTLCache(maxsize=256, ttl=3600)
+
+def _invalidate_deployed(sf_client: OrgHandler, status: dict) -> None:
+    """Drops cached describes of the objects a deployment changed, the first time it is seen succeeded.
+
+    The submit-time invalidation is not enough on its own: a describe made while the
+    deployment is still running caches the old schema again.
+    """
+    if not (status["done"] and status["success"]):
+        return
+    with _describe_cache_lock:
+        if status["jobId"] in _invalidated_jobs:
+            return
+        _invalidated_jobs[status["jobId"]] = True
+    for object_name in status["deployedObjects"]:
+        _invalidate_describe(sf_client, object_name)
+
+def _deployment_text(deployment: dict) -> str:
+    """Describes a deploy submission, including the job ID to poll."""
+    if deployment.get("unchanged"):
+        return (f"It is identical to the last deployment (job ID: {deployment['jobId']}), so it was not redeployed. "
+                "Use poll_deploy_status to check that deployment's result, or pass force to redeploy it.")
+    return f"Deployment initiated (job ID: {deployment['jobId']}). Use poll_deploy_status to follow its progress."
+
+def _check_lookup_targets(sf_client: OrgHandler, objects: list[dict]) -> str | None:
+    """Describes every Lookup target in Composite batches; returns an error if one does not exist.
+
+    Targets created by the same call are skipped, since they are not in the org yet.
+    """
+    created = {obj.get("api_name") for obj in objects}
+    targets = [
+        field["referenceTo"]
+        for obj in objects
+        for field in obj.get("fields") or ()
+        if field.get("type") == "Lookup" and field.get("referenceTo") and field["referenceTo"] not in created
+    ]
+    if not targets:
+        return None
+    try:
+        sf_client.get_object_fields_many(targets)
+    except ValueError as e:
+        return f"Lookup target check failed: {e}"
+    return None
+
+# Keys consumed by create_metadata_package for objects with fields
+_OBJECT_PACKAGE_KEYS = ("name", "plural_name", "api_name", "description", "fields")
+
+# Optional create_einstein_model arguments, merged under the caller's values
+_EINSTEIN_MODEL_DEFAULTS = {
+    "model_capability": "BinaryClassification",
+    "goal": "Maximize",
+    "success_value": "true",
+    "failure_value": "false",
+    "algorithm_type": "XGBoost",
+    "fields": [],
+}
+
+# Metadata API types resolved once per mdapi client (each lookup builds a new zeep type)
+_mdapi_types: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+def _get_mdapi_types(mdapi) -> tuple:
+    """Returns the metadata types and invariant values used to create custom objects."""
+    cached = _mdapi_types.get(mdapi)
+    if cached is None:
+        cached = (
+            mdapi.CustomObject,
+            mdapi.CustomField,
+            mdapi.FieldType("Text"),
+            mdapi.DeploymentStatus("Deployed"),
+            mdapi.SharingModel("Read"),
+        )
+        _mdapi_types[mdapi] = cached
+    return cached
+
+def create_object_impl(sf_client: sfdc_client.OrgHandler, arguments: dict[str, str]) -> list[types.TextContent]:
     """Creates a new custom object via the Salesforce Tooling API using the simple-salesforce client."""
     name = arguments.get("name")
     plural_name = arguments.get("plural_name")
@@ -18,22 +142,25 @@ def create_object_impl(sf_client: sfdc_client.OrgHandler, arguments: dict[str, s
             text="Salesforce connection is not active. Cannot perform metadata deployment."
         )]
 
-    mdapi = sf_client.connection.mdapi
+    custom_object_type, custom_field_type, text_type, deployed, read_sharing = _get_mdapi_types(
+        sf_client.connection.mdapi
+    )
 
-    custom_object = mdapi.CustomObject(
+    custom_object = custom_object_type(
         fullName=api_name,
         label=name,
         pluralLabel=plural_name,
-        nameField=mdapi.CustomField(
+        nameField=custom_field_type(
             label="Name",
-            type=mdapi.FieldType("Text")
+            type=text_type
         ),
-        deploymentStatus=mdapi.DeploymentStatus("Deployed"),
-        sharingModel=mdapi.SharingModel("Read")
+        deploymentStatus=deployed,
+        sharingModel=read_sharing
     )
     
     try:
-        mdapi.CustomObject.create(custom_object)
+        custom_object_type.create(custom_object)
+        _invalidate_describe(sf_client, api_name)
         return [types.TextContent(
             type="text", 
             text=f"Custom Object '{api_name}' created successfully"
@@ -44,41 +171,99 @@ def create_object_impl(sf_client: sfdc_client.OrgHandler, arguments: dict[str, s
             text=f"Error creating custom object: {e}"
         )]
 
-def create_object_with_fields_impl(sf_client: sfdc_client.OrgHandler, arguments: dict[str, str]):
+def create_object_with_fields_impl(sf_client: sfdc_client.OrgHandler, arguments: dict[str, str]) -> list[types.TextContent]:
     """Creates a new custom object with fields via the Metadata API."""
-    name = arguments.get("name")
-    plural_name = arguments.get("plural_name")
-    api_name = arguments.get("api_name")
-    description = arguments.get("description")
-    fields = arguments.get("fields")
-
-    json_obj = {}
-    json_obj["name"] = name
-    json_obj["plural_name"] = plural_name
-    json_obj["api_name"] = api_name
-    json_obj["description"] = description
-    json_obj["fields"] = fields
+    json_obj = {key: arguments.get(key) for key in _OBJECT_PACKAGE_KEYS}
+    api_name = json_obj["api_name"]
 
     if not sf_client.connection:
         return [types.TextContent(
             type="text", 
             text="Salesforce connection is not active. Cannot perform metadata deployment."
         )]
-    
-    sfdc_client.write_to_file(json.dumps(json_obj))
-    sfdc_client.create_metadata_package(json_obj)
-    sfdc_client.create_send_to_server(sf_client.connection)
+
+    lookup_error = _check_lookup_targets(sf_client, [json_obj])
+    if lookup_error:
+        return [types.TextContent(type="text", text=lookup_error)]
+
+    with _deploy_lock:
+        sfdc_client.write_to_file(orjson.dumps(json_obj).decode())
+        sfdc_client.create_metadata_package(json_obj)
+        deployment = sfdc_client.create_send_to_server(sf_client.connection, bool(arguments.get("force")))
+    _invalidate_describe(sf_client, api_name)
 
     return [
         types.TextContent(
             type="text",
-            text=f"Custom Object '{api_name}' creation package prepared and deployment initiated."
+            text=f"Custom Object '{api_name}' creation package prepared. {_deployment_text(deployment)}"
         )
     ]
 
+def poll_deploy_status_impl(sf_client: OrgHandler, arguments: dict[str, str]) -> list[types.TextContent]:
+    """Reports the progress of a Metadata API deployment started by a creation tool."""
+    job_id = arguments.get("job_id")
+    if not job_id:
+        return [types.TextContent(type="text", text="Missing 'job_id' argument")]
+    if not sf_client.connection:
+        return [types.TextContent(type="text", text="Salesforce connection not established.")]
+
+    try:
+        status = sfdc_client.check_deploy_status(sf_client.connection, job_id)
+    except Exception as e:
+        return [types.TextContent(type="text", text=f"Error checking deployment status: {str(e)}")]
+    _invalidate_deployed(sf_client, status)
+    return [types.TextContent(type="text", text=orjson.dumps(status, option=orjson.OPT_INDENT_2).decode())]
+
+def create_objects_bulk_impl(sf_client: OrgHandler, arguments: dict[str, Any]) -> list[types.TextContent]:
+    """Creates several custom objects with fields, submitting their deployments concurrently."""
+    objects = arguments.get("objects")
+    if not objects:
+        return [types.TextContent(type="text", text="Missing 'objects' argument")]
+    if not sf_client.connection:
+        return [types.TextContent(
+            type="text",
+            text="Salesforce connection is not active. Cannot perform metadata deployment."
+        )]
+
+    lookup_error = _check_lookup_targets(sf_client, objects)
+    if lookup_error:
+        return [types.TextContent(type="text", text=lookup_error)]
+
+    # Every package gets its own staging directory, so no _deploy_lock is needed
+    staging_root = os.path.join(sfdc_client.BASE_PATH, sfdc_client.BULK_STAGING_DIR)
+    os.makedirs(staging_root, exist_ok=True)
+    staging_dir = tempfile.mkdtemp(dir=staging_root)
+    try:
+        package_dirs = []
+        for i, spec in enumerate(objects):
+            json_obj = {key: spec.get(key) for key in _OBJECT_PACKAGE_KEYS}
+            package_dir = os.path.join(staging_dir, str(i))
+            sfdc_client.write_to_file(orjson.dumps(json_obj).decode())
+            sfdc_client.create_metadata_package(json_obj, package_dir)
+            package_dirs.append(package_dir)
+
+        deployments = sfdc_client.deploy_many(sf_client.connection, package_dirs)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    results = []
+    for spec, deployment in zip(objects, deployments):
+        api_name = spec.get("api_name")
+        if isinstance(deployment, Exception):
+            results.append({"api_name": api_name, "error": str(deployment)})
+        else:
+            _invalidate_describe(sf_client, api_name)
+            results.append({"api_name": api_name, "jobId": deployment["jobId"]})
+
+    return [types.TextContent(
+        type="text",
+        text="Deployments submitted; use poll_deploy_status with each job ID to follow them.\n"
+             + orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()
+    )]
+
 # --- Data Query Implementations ---
 
-def run_soql_query_impl(sf_client: OrgHandler, arguments: dict[str, str]):
+def run_soql_query_impl(sf_client: OrgHandler, arguments: dict[str, str]) -> list[types.TextContent]:
     """Executes a SOQL query against Salesforce."""
     query = arguments.get("query")
     if not query:
@@ -87,11 +272,19 @@ def run_soql_query_impl(sf_client: OrgHandler, arguments: dict[str, str]):
         return [types.TextContent(type="text", text="Salesforce connection not established.")]
     
     try:
-        results = sf_client.connection.query_all(query)
+        # Same shape as query_all(), serialized page by page instead of materializing the full result
+        body = bytearray(b'{"records":[')
+        total = 0
+        for record in sf_client.connection.query_all_iter(query):
+            if total:
+                body += b","
+            body += orjson.dumps(record)
+            total += 1
+        body += b'],"totalSize":%d,"done":true}' % total
         return [
             types.TextContent(
                 type="text",
-                text=f"SOQL Query Results (JSON):\n{json.dumps(results, indent=2)}"
+                text=f"SOQL Query Results (JSON):\n{body.decode()}"
             )
         ]
     except SalesforceError as e:
@@ -99,7 +292,69 @@ def run_soql_query_impl(sf_client: OrgHandler, arguments: dict[str, str]):
     except Exception as e:
         return [types.TextContent(type="text", text=f"Error executing SOQL: {e}")]
 
-def run_sosl_search_impl(sf_client: OrgHandler, arguments: dict[str, str]):
+def _finish_soql_query(sf_client: OrgHandler, page: Any) -> list[types.TextContent]:
+    """Completes one query_many result, fetching any remaining pages, in run_soql_query_impl's format."""
+    if isinstance(page, SalesforceError):
+        return [types.TextContent(type="text", text=f"SOQL Error: {page.status} {page.resource_name} {page.content}")]
+    try:
+        records = page["records"]
+        while not page["done"]:
+            page = sf_client.connection.query_more(page["nextRecordsUrl"], identifier_is_url=True)
+            records.extend(page["records"])
+    except SalesforceError as e:
+        return [types.TextContent(type="text", text=f"SOQL Error: {e.status} {e.resource_name} {e.content}")]
+    except Exception as e:
+        return [types.TextContent(type="text", text=f"Error executing SOQL: {e}")]
+    body = orjson.dumps({"records": records, "totalSize": len(records), "done": True})
+    return [types.TextContent(type="text", text=f"SOQL Query Results (JSON):\n{body.decode()}")]
+
+def run_soql_queries_impl(sf_client: OrgHandler, queries: list[str],
+                          on_result: Callable[[int, list[types.TextContent]], None]) -> None:
+    """Executes several SOQL queries in one Composite Batch round-trip.
+
+    on_result(index, content) is called as each query completes, with content as
+    run_soql_query_impl would return it; queries with more pages are finished in
+    parallel so they do not hold up the rest of the batch.
+    """
+    if len(queries) < 2 or not sf_client.connection:
+        for i, query in enumerate(queries):
+            on_result(i, run_soql_query_impl(sf_client, {"query": query}))
+        return
+    try:
+        pages = sf_client.query_many(queries)
+    except Exception:
+        # A rejected batch says nothing about the individual queries, so run each on its own
+        with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+            futures = [
+                pool.submit(lambda i=i, query=query: on_result(i, run_soql_query_impl(sf_client, {"query": query})))
+                for i, query in enumerate(queries)
+            ]
+        # Re-raise a worker failure instead of dropping it with the future
+        for future in futures:
+            future.result()
+        return
+
+    paged = []
+    for i, page in enumerate(pages):
+        if isinstance(page, dict) and not page["done"]:
+            paged.append((i, page))
+        else:
+            on_result(i, _finish_soql_query(sf_client, page))
+    if paged:
+        with ThreadPoolExecutor(max_workers=len(paged)) as pool:
+            futures = [
+                pool.submit(lambda i=i, page=page: on_result(i, _finish_soql_query(sf_client, page)))
+                for i, page in paged
+            ]
+        for future in futures:
+            future.result()
+
+def iter_soql_ndjson(sf_client: OrgHandler, query: str) -> Iterator[bytes]:
+    """Yields the records of a SOQL query as newline-delimited JSON, one page at a time."""
+    for record in sf_client.connection.query_all_iter(query):
+        yield orjson.dumps(record) + b"\n"
+
+def run_sosl_search_impl(sf_client: OrgHandler, arguments: dict[str, str]) -> list[types.TextContent]:
     """Executes a SOSL search against Salesforce."""
     search = arguments.get("search")
     if not search:
@@ -112,7 +367,7 @@ def run_sosl_search_impl(sf_client: OrgHandler, arguments: dict[str, str]):
         return [
             types.TextContent(
                 type="text",
-                text=f"SOSL Search Results (JSON):\n{json.dumps(results, indent=2)}"
+                text=f"SOSL Search Results (JSON):\n{orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()}"
             )
         ]
     except SalesforceError as e:
@@ -120,24 +375,30 @@ def run_sosl_search_impl(sf_client: OrgHandler, arguments: dict[str, str]):
     except Exception as e:
         return [types.TextContent(type="text", text=f"Error executing SOSL: {e}")]
 
-def get_object_fields_impl(sf_client: OrgHandler, arguments: dict[str, str]):
+def get_object_fields_impl(sf_client: OrgHandler, arguments: dict[str, str]) -> list[types.TextContent]:
     """Retrieves detailed information about the fields of a Salesforce object."""
     object_name = arguments.get("object_name")
     if not object_name:
         return [types.TextContent(type="text", text="Missing 'object_name' argument")]
     
+    cache_key = ("get_object_fields", object_name)
+    return _cached_describe(cache_key, lambda: _get_object_fields_uncached(sf_client, object_name, cache_key))
+
+def _get_object_fields_uncached(sf_client: OrgHandler, object_name: str, cache_key: tuple) -> list[types.TextContent]:
     try:
         results = sf_client.get_object_fields_cached(object_name)
-        return [
+        content = [
             types.TextContent(
                 type="text",
-                text=f"{object_name} Fields Metadata (JSON):\n{json.dumps(results, indent=2)}"
+                text=f"{object_name} Fields Metadata (JSON):\n{orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()}"
             )
         ]
+        _set_cached_describe(cache_key, content)
+        return content
     except Exception as e:
          return [types.TextContent(type="text", text=f"Error getting fields for {object_name}: {e}")]
 
-def describe_object_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
+def describe_object_impl(sf_client: OrgHandler, arguments: dict[str, Any]) -> list[types.TextContent]:
     """Get detailed schema information for a Salesforce object, formatted as markdown."""
     object_name = arguments.get("object_name")
     include_field_details = arguments.get("include_field_details", True)
@@ -146,44 +407,59 @@ def describe_object_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
     if not sf_client.connection:
         return [types.TextContent(type="text", text="Salesforce connection not established.")]
     
+    cache_key = ("describe_object", object_name, include_field_details)
+    return _cached_describe(
+        cache_key, lambda: _describe_object_uncached(sf_client, object_name, include_field_details, cache_key)
+    )
+
+def _describe_object_uncached(sf_client: OrgHandler, object_name: str, include_field_details: bool,
+                              cache_key: tuple) -> list[types.TextContent]:
     try:
         sf_object = getattr(sf_client.connection, object_name)
         describe = sf_object.describe()
         
         # Basic object info
-        result = f"## {describe['label']} ({describe['name']})\n\n"
-        result += f"**Type:** {'Custom Object' if describe.get('custom') else 'Standard Object'}\n"
-        result += f"**API Name:** {describe['name']}\n"
-        result += f"**Label:** {describe['label']}\n"
-        result += f"**Plural Label:** {describe.get('labelPlural', '')}\n"
-        result += f"**Key Prefix:** {describe.get('keyPrefix', 'N/A')}\n"
-        result += f"**Createable:** {describe.get('createable')}\n"
-        result += f"**Updateable:** {describe.get('updateable')}\n"
-        result += f"**Deletable:** {describe.get('deletable')}\n\n"
+        parts = []
+        append = parts.append
+        append(
+            f"## {describe['label']} ({describe['name']})\n\n"
+            f"**Type:** {'Custom Object' if describe.get('custom') else 'Standard Object'}\n"
+            f"**API Name:** {describe['name']}\n"
+            f"**Label:** {describe['label']}\n"
+            f"**Plural Label:** {describe.get('labelPlural', '')}\n"
+            f"**Key Prefix:** {describe.get('keyPrefix', 'N/A')}\n"
+            f"**Createable:** {describe.get('createable')}\n"
+            f"**Updateable:** {describe.get('updateable')}\n"
+            f"**Deletable:** {describe.get('deletable')}\n\n"
+        )
         
         if include_field_details:
             # Fields table
-            result += "## Fields\n\n"
-            result += "| API Name | Label | Type | Required | Unique | External ID |\n"
-            result += "|----------|-------|------|----------|--------|------------|\n"
+            append(
+                "## Fields\n\n"
+                "| API Name | Label | Type | Required | Unique | External ID |\n"
+                "|----------|-------|------|----------|--------|------------|\n"
+            )
             for field in describe["fields"]:
                 required = "Yes" if not field.get("nillable", True) else "No"
                 unique = "Yes" if field.get("unique", False) else "No"
                 external_id = "Yes" if field.get("externalId", False) else "No"
-                result += f"| {field['name']} | {field['label']} | {field['type']} | {required} | {unique} | {external_id} |\n"
+                append(f"| {field['name']} | {field['label']} | {field['type']} | {required} | {unique} | {external_id} |\n")
             
             # Relationship fields
             reference_fields = [
                 f for f in describe["fields"] if f["type"] == "reference" and f.get("referenceTo")
             ]
             if reference_fields:
-                result += "\n## Relationship Fields\n\n"
-                result += "| API Name | Related To | Relationship Name |\n"
-                result += "|----------|-----------|-------------------|\n"
+                append(
+                    "\n## Relationship Fields\n\n"
+                    "| API Name | Related To | Relationship Name |\n"
+                    "|----------|-----------|-------------------|\n"
+                )
                 for field in reference_fields:
                     related_to = ", ".join(field["referenceTo"])
                     rel_name = field.get("relationshipName", "N/A")
-                    result += f"| {field['name']} | {related_to} | {rel_name} |\n"
+                    append(f"| {field['name']} | {related_to} | {rel_name} |\n")
             
             # Picklist fields
             picklist_fields = [
@@ -191,34 +467,35 @@ def describe_object_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
                 if f["type"] in ("picklist", "multipicklist") and f.get("picklistValues")
             ]
             if picklist_fields:
-                result += "\n## Picklist Fields\n\n"
+                append("\n## Picklist Fields\n\n")
                 for field in picklist_fields:
-                    result += f"### {field['label']} ({field['name']})\n\n"
-                    result += "| Value | Label | Default |\n"
-                    result += "|-------|-------|--------|\n"
+                    append(
+                        f"### {field['label']} ({field['name']})\n\n"
+                        "| Value | Label | Default |\n"
+                        "|-------|-------|--------|\n"
+                    )
                     for value in field["picklistValues"]:
                         is_default = "Yes" if value.get("defaultValue", False) else "No"
-                        result += f"| {value['value']} | {value['label']} | {is_default} |\n"
-                    result += "\n"
+                        append(f"| {value['value']} | {value['label']} | {is_default} |\n")
+                    append("\n")
         
-        return [types.TextContent(type="text", text=result)]
+        content = [types.TextContent(type="text", text="".join(parts))]
+        _set_cached_describe(cache_key, content)
+        return content
     except Exception as e:
         return [types.TextContent(type="text", text=f"Error describing object {object_name}: {str(e)}")]
 
 # --- Einstein Studio Model Implementations ---
 
-def create_einstein_model_impl(sf_client: OrgHandler, arguments: dict[str, Any]):
+def create_einstein_model_impl(sf_client: OrgHandler, arguments: dict[str, Any]) -> list[types.TextContent]:
     """Creates an Einstein Studio model using AppFrameworkTemplateBundle."""
-    model_name = arguments.get("model_name")
-    description = arguments.get("description")
-    model_capability = arguments.get("model_capability", "BinaryClassification")
-    outcome_field = arguments.get("outcome_field")
-    goal = arguments.get("goal", "Maximize")
-    data_source = arguments.get("data_source")
-    success_value = arguments.get("success_value", "true")
-    failure_value = arguments.get("failure_value", "false")
-    algorithm_type = arguments.get("algorithm_type", "XGBoost")
-    fields = arguments.get("fields", [])
+    json_obj = {**_EINSTEIN_MODEL_DEFAULTS, **arguments}
+    force = bool(json_obj.pop("force", False))
+    model_name = json_obj.get("model_name")
+    description = json_obj.get("description")
+    outcome_field = json_obj.get("outcome_field")
+    data_source = json_obj.get("data_source")
+    fields = json_obj["fields"]
 
     # Validate required fields
     if not all([model_name, description, outcome_field, data_source, fields]):
@@ -234,28 +511,15 @@ def create_einstein_model_impl(sf_client: OrgHandler, arguments: dict[str, Any])
         )]
 
     try:
-        # Create Einstein Studio model package
-        json_obj = {
-            "model_name": model_name,
-            "description": description,
-            "model_capability": model_capability,
-            "outcome_field": outcome_field,
-            "goal": goal,
-            "data_source": data_source,
-            "success_value": success_value,
-            "failure_value": failure_value,
-            "algorithm_type": algorithm_type,
-            "fields": fields
-        }
-
-        sfdc_client.write_to_file(json.dumps(json_obj))
-        sfdc_client.create_einstein_model_package(json_obj)
-        sfdc_client.deploy_package_from_deploy_dir(sf_client.connection)
+        with _deploy_lock:
+            sfdc_client.write_to_file(orjson.dumps(json_obj).decode())
+            sfdc_client.create_einstein_model_package(json_obj)
+            deployment = sfdc_client.deploy_package_from_deploy_dir(sf_client.connection, force)
 
         return [
             types.TextContent(
                 type="text",
-                text=f"Einstein Studio model '{model_name}' creation package prepared and deployment initiated."
+                text=f"Einstein Studio model '{model_name}' creation package prepared. {_deployment_text(deployment)}"
             )
         ]
     except Exception as e:
@@ -1,4 +1,5 @@
 import asyncio
+from typing import Any, Callable
 
 import mcp.types as types
 from mcp.server import Server, NotificationOptions
@@ -13,8 +14,28 @@ from . import implementations as sfmcpimpl
 server = Server("salesforce-mcp")
 
 sf_client = sfdc_client.OrgHandler()
-if not sf_client.establish_connection():
-    print("Failed to initialize Salesforce connection")
+
+# Tool implementations block on Salesforce HTTP calls, so they run in worker
+# threads; this caps how many hit the org at once
+MAX_CONCURRENT_TOOL_CALLS = 4
+_tool_call_slots = asyncio.Semaphore(MAX_CONCURRENT_TOOL_CALLS)
+
+TOOL_DISPATCH: dict[str, Callable[[sfdc_client.OrgHandler, dict[str, Any]], list[types.TextContent]]] = {
+    # Object Creation Tools
+    "create_object": sfmcpimpl.create_object_impl,
+    "create_object_with_fields": sfmcpimpl.create_object_with_fields_impl,
+    "create_objects_bulk": sfmcpimpl.create_objects_bulk_impl,
+    "poll_deploy_status": sfmcpimpl.poll_deploy_status_impl,
+
+    # Data Query Tools
+    "run_soql_query": sfmcpimpl.run_soql_query_impl,
+    "run_sosl_search": sfmcpimpl.run_sosl_search_impl,
+    "get_object_fields": sfmcpimpl.get_object_fields_impl,
+    "describe_object": sfmcpimpl.describe_object_impl,
+
+    # Einstein Studio Model Tools
+    "create_einstein_model": sfmcpimpl.create_einstein_model_impl,
+}
 
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
@@ -22,47 +43,38 @@ async def handle_list_tools() -> list[types.Tool]:
     List available tools.
     Returns object creation, data query, and Einstein Studio model tools.
     """
-    return sfmcpdef.get_tools()
+    return list(sfmcpdef.get_tools())
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict[str, str]) -> list[types.TextContent]:
-    # Object Creation Tools
-    if name == "create_object":
-        return sfmcpimpl.create_object_impl(sf_client, arguments)
-    elif name == "create_object_with_fields":
-        return sfmcpimpl.create_object_with_fields_impl(sf_client, arguments)
-    
-    # Data Query Tools
-    elif name == "run_soql_query":
-        return sfmcpimpl.run_soql_query_impl(sf_client, arguments)
-    elif name == "run_sosl_search":
-        return sfmcpimpl.run_sosl_search_impl(sf_client, arguments)
-    elif name == "get_object_fields":
-        return sfmcpimpl.get_object_fields_impl(sf_client, arguments)
-    elif name == "describe_object":
-        return sfmcpimpl.describe_object_impl(sf_client, arguments)
-    
-    # Einstein Studio Model Tools
-    elif name == "create_einstein_model":
-        return sfmcpimpl.create_einstein_model_impl(sf_client, arguments)
-    
-    else:
+    impl = TOOL_DISPATCH.get(name)
+    if impl is None:
         raise ValueError(f"Unknown tool: {name}")
 
+    # Usually already done: the login started alongside the stdio handshake
+    await sf_client.ensure_connection()
+    async with _tool_call_slots:
+        return await asyncio.to_thread(impl, sf_client, arguments)
+
 async def run():
-    async with mcp.server.stdio.stdio_server() as (read, write):
-        await server.run(
-            read,
-            write,
-            InitializationOptions(
-                server_name="salesforce-mcp",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    # Log in concurrently with the stdio handshake instead of before it
+    sf_client.start_connection()
+    try:
+        async with mcp.server.stdio.stdio_server() as (read, write):
+            await server.run(
+                read,
+                write,
+                InitializationOptions(
+                    server_name="salesforce-mcp",
+                    server_version="0.1.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        sf_client.close()
 
 if __name__ == "__main__":
     asyncio.run(run())
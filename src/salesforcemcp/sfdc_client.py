@@ -1,15 +1,99 @@
-import json
+import asyncio
 import time
 import shutil
+import sqlite3
+import hashlib
+import threading
 import os
+import re
 import base64
+import io
 import zipfile
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from simple_salesforce import Salesforce
+from simple_salesforce.exceptions import SalesforceError
+from functools import lru_cache
+from string import Template
 from typing import Optional, Any
 import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape as xml_escape, unescape as xml_unescape
 
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DEPLOY_DIR = "deployment_package"
+# SFMCP_DEBUG=1 keeps full deploy request and response bodies in deploy.log / deploy_http.log
+_DEBUG = os.getenv("SFMCP_DEBUG") == "1"
+# Packages are small XML/JSON trees: fastest deflate level, no compression below the threshold
+ZIP_COMPRESS_LEVEL = 1
+ZIP_STORED_MAX_BYTES = 512
+# Files above this size are streamed into the archive by zipfile instead of read whole
+ZIP_STREAM_MIN_BYTES = 1024 * 1024
+# Range of timestamps a zip entry can hold
+_ZIP_MIN_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+_ZIP_MAX_DATE_TIME = (2107, 12, 31, 23, 59, 59)
+# Largest slice of an unparseable error response kept in exception messages
+ERROR_SNIPPET_BYTES = 4096
+# Einstein model bundle sources under assets/
+EINSTEIN_TEMPLATE_DIR = "create_einstein_model_tmpl/appTemplates/##template_name##"
+
+# (output path, template under assets/) pairs rendered into each package
+OBJECT_PACKAGE_MANIFEST = (
+    ("package.xml", "create_object_tmpl/package.xml"),
+    ("objects/{api_name}.object", "create_object_tmpl/objects/##api_name##.object"),
+    ("profiles/Admin.profile", "profile.tmpl"),
+)
+EINSTEIN_PACKAGE_MANIFEST = (
+    ("package.xml", "create_einstein_model_tmpl/package.xml"),
+    ("appTemplates/{template_name}/template-info.json", f"{EINSTEIN_TEMPLATE_DIR}/template-info.json"),
+    ("appTemplates/{template_name}/ml/containers/ModelContainer.json", f"{EINSTEIN_TEMPLATE_DIR}/ml/containers/ModelContainer.json"),
+    ("appTemplates/{template_name}/ml/setups/ModelSetup.json", f"{EINSTEIN_TEMPLATE_DIR}/ml/setups/ModelSetup.json"),
+)
+# Einstein bundle files without placeholders
+EINSTEIN_STATIC_FILES = ("create-chain.json", "layout.json", "variables.json")
+# Size of the keep-alive connection pool shared by concurrent Salesforce calls
+HTTP_POOL_SIZE = 50
+# Transient gateway errors are retried on the pooled connection; urllib3 only
+# retries idempotent methods by default, so deploy POSTs are never replayed
+HTTP_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504), raise_on_status=False)
+# Describe results persisted across processes, one SQLite file per org
+DESCRIBE_CACHE_DIR = ".describe_cache"
+DESCRIBE_CACHE_TTL = 3600
+METADATA_API_VERSION = "58.0"
+METADATA_NS = "{http://soap.sforce.com/2006/04/metadata}"
+# Tree hash and job ID of the last submitted package, used to skip identical redeploys
+LAST_DEPLOY_FILE = ".last_deploy.hash"
+# Parallel Metadata API submissions made by deploy_many
+DEPLOY_CONCURRENCY = int(os.getenv("SFMCP_DEPLOY_CONCURRENCY", "4"))
+# Per-package staging directories for bulk object creation
+BULK_STAGING_DIR = "bulk_packages"
+# (connect, read) timeouts in seconds for Metadata API deploy calls
+DEPLOY_TIMEOUT = (5, 120)
+# Maximum subrequests accepted by a single Composite API call
+COMPOSITE_BATCH_SIZE = 25
+# Seconds to wait before logging in again after a failure, doubling per consecutive failure
+CONNECT_BACKOFF_BASE = 1.0
+CONNECT_BACKOFF_MAX = 60.0
+
+@lru_cache(maxsize=None)
+def _load_template(relpath):
+    """Reads and compiles a template under assets/ once per process."""
+    with open(os.path.join(BASE_PATH, "assets", relpath), "r", encoding="utf-8") as f:
+        return Template(f.read())
+
+def _render_package(destination, manifest, context):
+    """Writes each (target path, template) pair of a manifest into destination.
+
+    Target paths are str.format patterns and templates are rendered with the same context.
+    """
+    for target, template in manifest:
+        path = os.path.join(destination, target.format(**context))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_load_template(template).safe_substitute(context))
 
 def _clean_deploy_dir():
     """Removes and recreates the deployment directory."""
@@ -18,12 +102,63 @@ def _clean_deploy_dir():
         shutil.rmtree(deploy_path)
     os.makedirs(deploy_path, exist_ok=True)
 
+def _shape_describe(object_name: str, describe: dict) -> dict:
+    """Reduces a raw sObject describe to the field summary served by the tools."""
+    # Extract field information
+    fields_info = []
+    for field in describe.get("fields", []):
+        field_info = {
+            "name": field.get("name"),
+            "label": field.get("label"),
+            "type": field.get("type"),
+            "length": field.get("length"),
+            "required": not field.get("nillable", True),
+            "unique": field.get("unique", False),
+            "externalId": field.get("externalId", False),
+            "createable": field.get("createable", False),
+            "updateable": field.get("updateable", False),
+        }
+
+        # Add picklist values if applicable
+        if field.get("type") in ("picklist", "multipicklist") and field.get("picklistValues"):
+            field_info["picklistValues"] = field.get("picklistValues")
+
+        # Add reference info if applicable  
+        if field.get("type") == "reference" and field.get("referenceTo"):
+            field_info["referenceTo"] = field.get("referenceTo")
+            field_info["relationshipName"] = field.get("relationshipName")
+
+        fields_info.append(field_info)
+
+    return {
+        "objectName": object_name,
+        "fields": fields_info,
+        "objectInfo": {
+            "label": describe.get("label"),
+            "labelPlural": describe.get("labelPlural"),
+            "custom": describe.get("custom", False),
+            "createable": describe.get("createable", False),
+            "updateable": describe.get("updateable", False),
+            "deletable": describe.get("deletable", False)
+        }
+    }
+
 class OrgHandler:
     """Manages interactions and caching for a Salesforce org."""
 
     def __init__(self):
         self.connection: Optional[Salesforce] = None
         self.metadata_cache: dict[str, Any] = {}
+        self._metadata_expiry: dict[str, float] = {}
+        self._metadata_cache_lock = threading.Lock()
+        self._disk_cache: Optional[sqlite3.Connection] = None
+        self._describe_locks: dict[str, threading.Lock] = {}
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=HTTP_RETRY)
+        self.session.mount("https://", adapter)
+        self._connect_task: Optional[asyncio.Future] = None
+        self._connect_failures = 0
+        self._next_connect_at = 0.0
 
     def establish_connection(self) -> bool:
         """Initiates and authenticates the connection to the Salesforce org.
@@ -35,14 +170,135 @@ class OrgHandler:
             self.connection = Salesforce(
                 username=os.getenv("USERNAME"),
                 password=os.getenv("PASSWORD"),
-                security_token=os.getenv("SECURITY_TOKEN")
+                security_token=os.getenv("SECURITY_TOKEN"),
+                session=self.session
             )
+            self._open_disk_cache()
             return True
         except Exception as e:
             print(f"Failed to establish Salesforce connection: {str(e)}")
             self.connection = None
             return False
 
+    def _open_disk_cache(self) -> None:
+        """Opens the on-disk describe cache for the connected org; failures leave it disabled."""
+        org_key = hashlib.sha256(self.connection.sf_instance.encode()).hexdigest()[:16]
+        cache_dir = os.path.join(BASE_PATH, DESCRIBE_CACHE_DIR)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            disk_cache = sqlite3.connect(os.path.join(cache_dir, f"{org_key}.sqlite"), check_same_thread=False)
+            disk_cache.execute(
+                "CREATE TABLE IF NOT EXISTS describes (name TEXT PRIMARY KEY, payload BLOB, expiry REAL)"
+            )
+        except sqlite3.Error as e:
+            print(f"Describe disk cache disabled: {str(e)}")
+            return
+        with self._metadata_cache_lock:
+            if self._disk_cache is not None:
+                self._disk_cache.close()
+            self.metadata_cache.clear()
+            self._metadata_expiry.clear()
+            self._disk_cache = disk_cache
+
+    def _disable_disk_cache(self, error: sqlite3.Error) -> None:
+        """Falls back to memory-only caching after a disk cache failure; call with the cache lock held."""
+        print(f"Describe disk cache disabled: {str(error)}")
+        try:
+            self._disk_cache.close()
+        except sqlite3.Error:
+            pass
+        self._disk_cache = None
+
+    def _get_cached_fields(self, object_name: str) -> Optional[dict]:
+        """Looks up unexpired field metadata in memory, then on disk."""
+        now = time.time()
+        with self._metadata_cache_lock:
+            if self._metadata_expiry.get(object_name, 0.0) > now:
+                return self.metadata_cache[object_name]
+            self.metadata_cache.pop(object_name, None)
+            self._metadata_expiry.pop(object_name, None)
+            if self._disk_cache is None:
+                return None
+            try:
+                row = self._disk_cache.execute(
+                    "SELECT payload, expiry FROM describes WHERE name = ? AND expiry > ?", (object_name, now)
+                ).fetchone()
+            except sqlite3.Error as e:
+                self._disable_disk_cache(e)
+                return None
+            if row is None:
+                return None
+            cached = self.metadata_cache[object_name] = orjson.loads(row[0])
+            self._metadata_expiry[object_name] = row[1]
+            return cached
+
+    def _set_cached_fields(self, described: dict[str, dict]) -> None:
+        """Stores field metadata in memory and on disk."""
+        expiry = time.time() + DESCRIBE_CACHE_TTL
+        with self._metadata_cache_lock:
+            self.metadata_cache.update(described)
+            self._metadata_expiry.update(dict.fromkeys(described, expiry))
+            if self._disk_cache is not None:
+                try:
+                    with self._disk_cache:
+                        self._disk_cache.executemany(
+                            "INSERT OR REPLACE INTO describes (name, payload, expiry) VALUES (?, ?, ?)",
+                            [(name, orjson.dumps(result), expiry) for name, result in described.items()],
+                        )
+                except sqlite3.Error as e:
+                    self._disable_disk_cache(e)
+
+    def invalidate(self, object_name: str) -> None:
+        """Drops cached field metadata for an object, e.g. after deploying a change to it."""
+        with self._metadata_cache_lock:
+            self.metadata_cache.pop(object_name, None)
+            self._metadata_expiry.pop(object_name, None)
+            if self._disk_cache is not None:
+                try:
+                    with self._disk_cache:
+                        self._disk_cache.execute("DELETE FROM describes WHERE name = ?", (object_name,))
+                except sqlite3.Error as e:
+                    self._disable_disk_cache(e)
+
+    def close(self) -> None:
+        """Releases the pooled HTTP connections and the describe disk cache."""
+        self.session.close()
+        with self._metadata_cache_lock:
+            if self._disk_cache is not None:
+                self._disk_cache.close()
+                self._disk_cache = None
+
+    def _attempt_connection(self) -> bool:
+        """Runs establish_connection and schedules the earliest next attempt after a failure."""
+        if self.establish_connection():
+            self._connect_failures = 0
+            return True
+        self._connect_failures += 1
+        backoff = min(CONNECT_BACKOFF_BASE * 2 ** (self._connect_failures - 1), CONNECT_BACKOFF_MAX)
+        self._next_connect_at = time.monotonic() + backoff
+        return False
+
+    def start_connection(self) -> None:
+        """Starts authenticating in a worker thread without blocking the event loop."""
+        if self._connect_task is None or (
+            self._connect_task.done() and not self.connection and time.monotonic() >= self._next_connect_at
+        ):
+            self._connect_task = asyncio.ensure_future(asyncio.to_thread(self._attempt_connection))
+
+    async def ensure_connection(self) -> bool:
+        """Waits for the background login, starting a new attempt if none succeeded.
+
+        Concurrent callers share one attempt, and after a failed login callers get
+        False right away until the backoff delay has passed.
+
+        Returns:
+            bool: Returns True once the org connection is available, False otherwise.
+        """
+        if self.connection:
+            return True
+        self.start_connection()
+        return await asyncio.shield(self._connect_task)
+
     def get_object_fields_cached(self, object_name: str) -> dict:
         """Retrieves and caches field information for a Salesforce object.
         
@@ -59,55 +315,31 @@ class OrgHandler:
             raise ValueError("Salesforce connection not established.")
             
         # Check cache first
-        if object_name in self.metadata_cache:
-            return self.metadata_cache[object_name]
-            
+        cached = self._get_cached_fields(object_name)
+        if cached is not None:
+            return cached
+
+        # Single-flight: concurrent callers for the same object share one describe
+        with self._describe_locks.setdefault(object_name, threading.Lock()):
+            cached = self._get_cached_fields(object_name)
+            if cached is not None:
+                return cached
+            try:
+                return self._describe_blocking(object_name)
+            finally:
+                # Callers still waiting on this lock find the cached result; later misses start afresh
+                self._describe_locks.pop(object_name, None)
+
+    def _describe_blocking(self, object_name: str) -> dict:
+        """Describes an object over the network and caches the field summary."""
         try:
             # Get object description
             sf_object = getattr(self.connection, object_name)
             describe = sf_object.describe()
             
-            # Extract field information
-            fields_info = []
-            for field in describe.get("fields", []):
-                field_info = {
-                    "name": field.get("name"),
-                    "label": field.get("label"),
-                    "type": field.get("type"),
-                    "length": field.get("length"),
-                    "required": not field.get("nillable", True),
-                    "unique": field.get("unique", False),
-                    "externalId": field.get("externalId", False),
-                    "createable": field.get("createable", False),
-                    "updateable": field.get("updateable", False),
-                }
-                
-                # Add picklist values if applicable
-                if field.get("type") in ("picklist", "multipicklist") and field.get("picklistValues"):
-                    field_info["picklistValues"] = field.get("picklistValues")
-                    
-                # Add reference info if applicable  
-                if field.get("type") == "reference" and field.get("referenceTo"):
-                    field_info["referenceTo"] = field.get("referenceTo")
-                    field_info["relationshipName"] = field.get("relationshipName")
-                    
-                fields_info.append(field_info)
-            
-            # Cache the result
-            result = {
-                "objectName": object_name,
-                "fields": fields_info,
-                "objectInfo": {
-                    "label": describe.get("label"),
-                    "labelPlural": describe.get("labelPlural"),
-                    "custom": describe.get("custom", False),
-                    "createable": describe.get("createable", False),
-                    "updateable": describe.get("updateable", False),
-                    "deletable": describe.get("deletable", False)
-                }
-            }
-            
-            self.metadata_cache[object_name] = result
+            result = _shape_describe(object_name, describe)
+
+            self._set_cached_fields({object_name: result})
             return result
             
         except AttributeError:
@@ -115,55 +347,139 @@ class OrgHandler:
         except Exception as e:
             raise ValueError(f"Error retrieving fields for {object_name}: {str(e)}")
 
-def write_to_file(content):
-    """Writes content to a log file."""
-    with open(f"{BASE_PATH}/mylog.txt", 'a') as f:
-        f.write(content)
+    def get_object_fields_many(self, object_names: list[str]) -> dict[str, dict]:
+        """Retrieves field information for several objects with Composite API batches.
 
-def zip_directory(filepath):
-    """Zips a directory."""
-    source_directory = filepath
-    output_zip_name = f"{BASE_PATH}/pack"
-    shutil.make_archive(output_zip_name, 'zip', source_directory)
+        Uncached objects are described COMPOSITE_BATCH_SIZE at a time in a single
+        round-trip per batch; a batch rejected with a 5xx falls back to one
+        describe per object.
 
-def binary_to_base64(file_path):
-    """Converts a binary file to base64 encoding."""
-    try:
-        with open(file_path, "rb") as binary_file:
-            binary_data = binary_file.read()
-            base64_encoded = base64.b64encode(binary_data)
-            return base64_encoded.decode('utf-8')
-    except FileNotFoundError:
-        print(f"File not found: {file_path}")
-        return None
+        Args:
+            object_names: The API names of the Salesforce objects
 
-import requests
+        Returns:
+            dict: Field metadata keyed by object name
 
-def deploy(b64, sf):
-    """Deploys the zipped package using the provided simple_salesforce connection."""
-    if not sf:
-         print("Error: Salesforce connection object (sf) not provided to deploy function.")
-         raise ValueError("Deployment failed: Invalid Salesforce connection.")
+        Raises:
+            ValueError: If connection is not established or an object doesn't exist
+        """
+        if not self.connection:
+            raise ValueError("Salesforce connection not established.")
 
-    try:
-        session_id = sf.session_id
-        instance_url = sf.sf_instance
-        if not instance_url:
-             raise ValueError("Could not retrieve instance URL from Salesforce connection.")
+        results: dict[str, dict] = {}
+        missing = []
+        for name in dict.fromkeys(object_names):
+            cached = self._get_cached_fields(name)
+            if cached is None:
+                missing.append(name)
+            else:
+                results[name] = cached
 
-        metadata_api_version = "58.0" 
-        endpoint = f"https://{instance_url}/services/Soap/m/{metadata_api_version}"
-        print(f"Using dynamic endpoint: {endpoint}")
-    except AttributeError as e:
-         print(f"Error accessing connection attributes: {e}")
-         raise ValueError("Deployment failed: Could not get session details from Salesforce connection.")
+        for start in range(0, len(missing), COMPOSITE_BATCH_SIZE):
+            batch = missing[start:start + COMPOSITE_BATCH_SIZE]
+            try:
+                described = self._describe_composite(batch)
+            except SalesforceError as e:
+                if e.status < 500:
+                    raise ValueError(f"Error retrieving fields for {', '.join(batch)}: {str(e)}")
+                for name in batch:
+                    results[name] = self.get_object_fields_cached(name)
+                continue
 
-    headers = {
-        "Content-Type": "text/xml; charset=utf-8",
-        'SOAPAction': '""'
-    }
+            self._set_cached_fields(described)
+            results.update(described)
+
+        return results
+
+    def _describe_composite(self, object_names: list[str]) -> dict[str, dict]:
+        """Describes up to COMPOSITE_BATCH_SIZE objects in one Composite API request."""
+        base = f"/services/data/v{self.connection.sf_version}/sobjects"
+        response = self.connection.restful("composite", method="POST", json={
+            "allOrNone": False,
+            "compositeRequest": [
+                {"method": "GET", "url": f"{base}/{name}/describe", "referenceId": f"r{i}"}
+                for i, name in enumerate(object_names)
+            ],
+        })
+
+        described = {}
+        for name, sub in zip(object_names, response["compositeResponse"]):
+            if sub["httpStatusCode"] != 200:
+                raise ValueError(f"Object '{name}' not found or not accessible.")
+            described[name] = _shape_describe(name, sub["body"])
+        return described
+
+    def query_many(self, queries: list[str]) -> list[Any]:
+        """Runs up to COMPOSITE_BATCH_SIZE SOQL queries in one Composite Batch request.
+
+        Args:
+            queries: The SOQL queries to execute
+
+        Returns:
+            list: Per query, in order, either the first page of its result (follow
+            nextRecordsUrl with query_more while done is false) or the
+            SalesforceError its subrequest failed with
+
+        Raises:
+            ValueError: If connection is not established
+            SalesforceError: If the batch request itself is rejected
+        """
+        if not self.connection:
+            raise ValueError("Salesforce connection not established.")
+
+        response = self.connection.restful("composite/batch", method="POST", json={
+            "haltOnError": False,
+            "batchRequests": [
+                {"method": "GET", "url": f"v{self.connection.sf_version}/query?q={quote(query)}"}
+                for query in queries
+            ],
+        })
 
-    xml_body_template = """<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" xmlns:met="http://soap.sforce.com/2006/04/metadata">
+        return [
+            SalesforceError("composite/batch", sub["statusCode"], "query", sub["result"])
+            if sub["statusCode"] >= 400 else sub["result"]
+            for sub in response["results"]
+        ]
+
+def write_to_file(content):
+    """Writes content to a log file."""
+    with open(f"{BASE_PATH}/mylog.txt", 'a') as f:
+        f.write(content)
+
+def _iter_files(root):
+    """Yields (path, stat) for every file under root, using scandir's cached entry types."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path)
+            else:
+                yield entry.path, entry.stat()
+
+def zip_directory(filepath) -> memoryview:
+    """Zips the contents of a directory in memory, with paths relative to it.
+
+    Returns a view of the archive buffer rather than a copy of it; the deploy
+    envelope base64-encodes straight from this view.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESS_LEVEL,
+                         strict_timestamps=False) as zf:
+        for path, st in _iter_files(filepath):
+            arcname = os.path.relpath(path, filepath)
+            if st.st_size > ZIP_STREAM_MIN_BYTES:
+                zf.write(path, arcname)
+                continue
+            date_time = min(max(time.localtime(st.st_mtime)[:6], _ZIP_MIN_DATE_TIME), _ZIP_MAX_DATE_TIME)
+            info = zipfile.ZipInfo(arcname, date_time)
+            info.external_attr = (st.st_mode & 0xFFFF) << 16
+            # Deflate headers outweigh any savings on tiny files
+            info.compress_type = zipfile.ZIP_STORED if st.st_size < ZIP_STORED_MAX_BYTES else zipfile.ZIP_DEFLATED
+            with open(path, "rb") as f:
+                # A hand-built ZipInfo does not inherit the archive's level, so pass it explicitly
+                zf.writestr(info, f.read(), compresslevel=ZIP_COMPRESS_LEVEL)
+    return buffer.getbuffer()
+
+_DEPLOY_ENVELOPE_PRE = """<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" xmlns:met="http://soap.sforce.com/2006/04/metadata">
    <soapenv:Header>
       <met:SessionHeader>
          <met:sessionId>{session_id}</met:sessionId>
@@ -171,7 +487,9 @@ def deploy(b64, sf):
    </soapenv:Header>
    <soapenv:Body>
       <met:deploy>
-         <met:ZipFile>{base64_zip}</met:ZipFile>
+         <met:ZipFile>"""
+
+_DEPLOY_ENVELOPE_POST = b"""</met:ZipFile>
          <met:DeployOptions>
             <met:allowMissingFiles>false</met:allowMissingFiles>
             <met:autoUpdatePackage>false</met:autoUpdatePackage>
@@ -187,40 +505,119 @@ def deploy(b64, sf):
 </soapenv:Envelope>
     """
 
-    if b64 is None:
-        print("Error: Base64 package data is None. Cannot deploy.")
+# Raw bytes base64-encoded per chunk; a multiple of 3 so chunks concatenate cleanly
+_B64_CHUNK_SIZE = 57 * 1024
+
+class _DeployEnvelope:
+    """SOAP deploy body that base64-encodes the zip while it is being sent.
+
+    Defining __len__ lets requests send a Content-Length instead of chunked encoding.
+    """
+
+    def __init__(self, session_id: str, zip_bytes: bytes | memoryview):
+        self.pre = _DEPLOY_ENVELOPE_PRE.format(session_id=session_id).encode()
+        self.zip_bytes = zip_bytes
+
+    def __len__(self) -> int:
+        return len(self.pre) + 4 * ((len(self.zip_bytes) + 2) // 3) + len(_DEPLOY_ENVELOPE_POST)
+
+    def __iter__(self):
+        yield self.pre
+        view = memoryview(self.zip_bytes)
+        for start in range(0, len(view), _B64_CHUNK_SIZE):
+            yield base64.b64encode(view[start:start + _B64_CHUNK_SIZE])
+        yield _DEPLOY_ENVELOPE_POST
+
+def _response_snippet(response):
+    """Decodes at most ERROR_SNIPPET_BYTES of a response body for error messages."""
+    return response.content[:ERROR_SNIPPET_BYTES].decode("utf-8", "replace")
+
+# Fault fields are matched on the raw bytes so error paths skip building a DOM of large responses
+_FAULT_CODE_RE = re.compile(rb"<(?:\w+:)?faultcode[^>]*>(.*?)</(?:\w+:)?faultcode>", re.S)
+_FAULT_STRING_RE = re.compile(rb"<(?:\w+:)?faultstring[^>]*>(.*?)</(?:\w+:)?faultstring>", re.S)
+
+def _parse_soap_fault(content: bytes) -> Optional[tuple[Optional[str], Optional[str]]]:
+    """Returns (faultcode, faultstring) of a SOAP fault response, or None if it holds no fault.
+
+    Raises:
+        ET.ParseError: If the regex finds no fault and the body is not valid XML
+    """
+    faultstring = _FAULT_STRING_RE.search(content)
+    if faultstring is not None:
+        faultcode = _FAULT_CODE_RE.search(content)
+        return (
+            xml_unescape(faultcode.group(1).decode("utf-8", "replace")) if faultcode else None,
+            xml_unescape(faultstring.group(1).decode("utf-8", "replace")),
+        )
+
+    root = ET.fromstring(content)
+    fault = root.find('.//{http://schemas.xmlsoap.org/soap/envelope/}Fault')
+    if fault is None:
+        return None
+    return fault.findtext('{*}faultcode'), fault.findtext('{*}faultstring')
+
+def deploy(zip_bytes, sf):
+    """Submits the zipped package for deployment and returns {"jobId": ...} without waiting for it."""
+    if not sf:
+         print("Error: Salesforce connection object (sf) not provided to deploy function.")
+         raise ValueError("Deployment failed: Invalid Salesforce connection.")
+
+    try:
+        session_id = sf.session_id
+        instance_url = sf.sf_instance
+        if not instance_url:
+             raise ValueError("Could not retrieve instance URL from Salesforce connection.")
+
+        endpoint = f"https://{instance_url}/services/Soap/m/{METADATA_API_VERSION}"
+        print(f"Using dynamic endpoint: {endpoint}")
+    except AttributeError as e:
+         print(f"Error accessing connection attributes: {e}")
+         raise ValueError("Deployment failed: Could not get session details from Salesforce connection.")
+
+    headers = {
+        "Content-Type": "text/xml; charset=utf-8",
+        'SOAPAction': '""'
+    }
+
+    if zip_bytes is None:
+        print("Error: Package data is None. Cannot deploy.")
         raise ValueError("Deployment failed: Invalid package data.")
 
-    xml_body = xml_body_template.format(session_id=session_id, base64_zip=b64)
+    xml_body = _DeployEnvelope(session_id, zip_bytes)
 
-    with open(f"{BASE_PATH}/deploy.log", "w", encoding="utf-8") as file:
-        file.write(xml_body)
+    # Request bodies can be several MB; only keep a copy when debugging
+    if _DEBUG:
+        with open(f"{BASE_PATH}/deploy.log", "wb") as file:
+            file.writelines(xml_body)
 
     try:
-        response = requests.post(endpoint, data=xml_body, headers=headers)
+        # sf.session is the org's pooled session, so deploys reuse a warm TLS connection
+        response = sf.session.post(endpoint, data=xml_body, headers=headers, timeout=DEPLOY_TIMEOUT)
         
         print(f"Deployment API Response Status: {response.status_code}")
-        print(f"Deployment API Response Text:\n{response.text}")
-        with open(f"{BASE_PATH}/deploy_http.log", "w", encoding="utf-8") as file:
-            file.write(response.text)
+        if _DEBUG:
+            print(f"Deployment API Response Text:\n{response.text}")
+            with open(f"{BASE_PATH}/deploy_http.log", "wb") as file:
+                file.write(response.content)
 
         if response.status_code >= 400:
              fault_message = f"HTTP Error {response.status_code}."
              try:
-                 root = ET.fromstring(response.text)
-                 fault = root.find('.//{http://schemas.xmlsoap.org/soap/envelope/}Fault')
+                 fault = _parse_soap_fault(response.content)
                  if fault is not None:
-                     faultcode = fault.findtext('{*}faultcode')
-                     faultstring = fault.findtext('{*}faultstring')
+                     faultcode, faultstring = fault
                      fault_message = f"SOAP Fault: Code='{faultcode}', Message='{faultstring}' (HTTP Status: {response.status_code})"
              except ET.ParseError:
                  fault_message += " Additionally, the response body was not valid XML."
              except Exception as parse_e:
                  print(f"Minor error parsing SOAP fault: {parse_e}")
-                 fault_message += f" Response Text: {response.text[:500]}..."
+                 fault_message += f" Response Text: {_response_snippet(response)}..."
              
              raise ValueError(f"Salesforce deployment API call failed: {fault_message}")
-        print("Deployment request submitted successfully to Salesforce.")
+        # The deploy runs asynchronously; its AsyncResult id is polled with check_deploy_status
+        job_id = ET.fromstring(response.content).findtext(f".//{METADATA_NS}id")
+        print(f"Deployment request submitted successfully to Salesforce (job ID: {job_id}).")
+        return {"jobId": job_id}
 
     except requests.exceptions.RequestException as req_e:
          print(f"Network error during deployment API call: {req_e}")
@@ -229,80 +626,163 @@ def deploy(b64, sf):
         print(f"Unexpected error during deployment call: {e}")
         raise
 
-def create_send_to_server(sf):
-    """Zips the current package and sends it for deployment using the provided sf connection."""
-    zip_directory(f"{BASE_PATH}/current")
-    b64 = binary_to_base64(f"{BASE_PATH}/pack.zip")
-    deploy(b64, sf)
+_CHECK_DEPLOY_STATUS_ENVELOPE = """<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" xmlns:met="http://soap.sforce.com/2006/04/metadata">
+   <soapenv:Header>
+      <met:SessionHeader>
+         <met:sessionId>{session_id}</met:sessionId>
+      </met:SessionHeader>
+   </soapenv:Header>
+   <soapenv:Body>
+      <met:checkDeployStatus>
+         <met:asyncProcessId>{job_id}</met:asyncProcessId>
+         <met:includeDetails>true</met:includeDetails>
+      </met:checkDeployStatus>
+   </soapenv:Body>
+</soapenv:Envelope>"""
+
+def check_deploy_status(sf, job_id):
+    """Fetches the state of a deployment submitted by deploy().
+
+    Returns:
+        dict: done, status and success flags, any component failures under errors, and
+        the objects whose CustomObject or CustomField components deployed under deployedObjects.
+    """
+    endpoint = f"https://{sf.sf_instance}/services/Soap/m/{METADATA_API_VERSION}"
+    headers = {
+        "Content-Type": "text/xml; charset=utf-8",
+        'SOAPAction': '""'
+    }
+    xml_body = _CHECK_DEPLOY_STATUS_ENVELOPE.format(session_id=sf.session_id, job_id=xml_escape(job_id))
+
+    response = sf.session.post(endpoint, data=xml_body.encode(), headers=headers, timeout=DEPLOY_TIMEOUT)
+    if response.status_code >= 400:
+        fault = _parse_soap_fault(response.content)
+        faultstring = fault[1] if fault else _response_snippet(response)
+        raise ValueError(f"checkDeployStatus failed (HTTP Status: {response.status_code}): {faultstring}")
+
+    result = ET.fromstring(response.content).find(f".//{METADATA_NS}result")
+    errors = [
+        {
+            "component": failure.findtext(f"{METADATA_NS}fullName"),
+            "componentType": failure.findtext(f"{METADATA_NS}componentType"),
+            "problem": failure.findtext(f"{METADATA_NS}problem"),
+        }
+        for failure in result.iterfind(f"{METADATA_NS}details/{METADATA_NS}componentFailures")
+    ]
+    error_message = result.findtext(f"{METADATA_NS}errorMessage")
+    if error_message:
+        errors.append({"problem": error_message})
+    # CustomField full names are "Object__c.Field__c"; both types change the object's describe
+    deployed_objects = {
+        success.findtext(f"{METADATA_NS}fullName").split(".", 1)[0]
+        for success in result.iterfind(f"{METADATA_NS}details/{METADATA_NS}componentSuccesses")
+        if success.findtext(f"{METADATA_NS}componentType") in ("CustomObject", "CustomField")
+    }
+
+    return {
+        "jobId": job_id,
+        "done": result.findtext(f"{METADATA_NS}done") == "true",
+        "status": result.findtext(f"{METADATA_NS}status"),
+        "success": result.findtext(f"{METADATA_NS}success") == "true",
+        "errors": errors,
+        "deployedObjects": sorted(deployed_objects),
+    }
 
-def create_metadata_package(json_obj):
-    """Creates a metadata package for custom object creation with fields."""
+def _tree_hash(root, sf_instance):
+    """Hashes a package tree by relative paths and file contents, scoped to the target org."""
+    tree = hashlib.sha256(sf_instance.encode())
+    for dirpath, dirs, files in os.walk(root):
+        dirs.sort()
+        for file in sorted(files):
+            abs_file = os.path.join(dirpath, file)
+            tree.update(os.path.relpath(abs_file, root).encode() + b"\0")
+            with open(abs_file, "rb") as f:
+                tree.update(hashlib.file_digest(f, "sha256").digest())
+    return tree.hexdigest()
+
+def _previous_deploy_holds(sf, job_id):
+    """Whether an earlier deployment of the same package succeeded or is still running."""
     try:
-        name = json_obj["name"]
-        plural_name = json_obj["plural_name"]
-        description = json_obj["description"]
-        api_name = json_obj["api_name"]
-        fields = json_obj["fields"]
+        status = check_deploy_status(sf, job_id)
+    except Exception as e:
+        print(f"Could not check deployment {job_id}, redeploying: {e}")
+        return False
+    return status["success"] or not status["done"]
 
-        try:
-            shutil.rmtree(f"{BASE_PATH}/current/")
-        except:
-            print("the current directory doesn't exist")
+def _deploy_directory(path, sf, force=False):
+    """Deploys a package directory unless it matches the last package submitted to the org.
 
-        source = f"{BASE_PATH}/assets/create_object_tmpl/"
-        destination = f"{BASE_PATH}/current/"
+    The earlier job is only reused while it is in progress or succeeded, so failed
+    deployments are retried; force=True always deploys.
 
-        shutil.copytree(source, destination)
+    Returns:
+        dict: {"jobId": ...}; an unchanged package reports the earlier job with "unchanged": True.
+    """
+    tree_hash = _tree_hash(path, sf.sf_instance)
+    last_deploy_path = os.path.join(BASE_PATH, LAST_DEPLOY_FILE)
+    try:
+        with open(last_deploy_path, "r", encoding="utf-8") as f:
+            last_hash, last_job_id = f.read().split()
+    except (OSError, ValueError):
+        last_hash = last_job_id = None
 
-        old_name = f"{BASE_PATH}/current/objects/##api_name##.object"
-        new_name = f"{BASE_PATH}/current/objects/{api_name}.object"
+    if not force and tree_hash == last_hash and _previous_deploy_holds(sf, last_job_id):
+        print(f"Package unchanged since deployment {last_job_id}; skipping redeploy.")
+        return {"jobId": last_job_id, "unchanged": True}
 
-        os.rename(old_name, new_name)
+    result = deploy(zip_directory(path), sf)
+    if result.get("jobId"):
+        with open(last_deploy_path, "w", encoding="utf-8") as f:
+            f.write(f"{tree_hash} {result['jobId']}")
+    return result
 
-        with open(f"{BASE_PATH}/assets/field.tmpl", "r", encoding="utf-8") as file:
-            field_tmpl = file.read()
+def create_send_to_server(sf, force=False):
+    """Zips the current package and sends it for deployment using the provided sf connection."""
+    return _deploy_directory(f"{BASE_PATH}/current", sf, force)
 
-        fields_str = ""
-        field_names = []
+# Type-specific <fields> markup for create_metadata_package; unknown types render as Number
+_TEXT_TYPE_DEF = """<type>Text</type>\n                    <length>100</length>"""
+_URL_TYPE_DEF = "<type>Url</type>"
+_NUMBER_TYPE_DEF = """<precision>18</precision>
+                        <scale>0</scale>
+                        <type>Number</type>"""
 
-        for field in fields:
-            type_def = ""
+def _render_text_type(field):
+    return _TEXT_TYPE_DEF
 
-            f_name = field["label"]
-            f_type = field["type"]
-            f_api_name = field["api_name"]
-            field_names.append(f_api_name)
+def _render_url_type(field):
+    return _URL_TYPE_DEF
 
-            if f_type == "Text":
-                type_def = """<type>Text</type>\n                    <length>100</length>"""
-            elif f_type == "URL":
-                type_def = "<type>Url</type>"
-            elif f_type == "Checkbox":
-                default_val = field.get("defaultValue", False)
-                type_def = f"<type>Checkbox</type>\n                    <defaultValue>{str(default_val).lower()}</defaultValue>"
-            elif f_type == "Lookup":
-                reference_to = field.get("referenceTo", "")
-                relationship_label = field.get("relationshipLabel", "")
-                relationship_name = field.get("relationshipName", "")
-                type_def = f"<type>Lookup</type>\n                    <referenceTo>{reference_to}</referenceTo>"
-                if relationship_label:
-                    type_def += f"\n                    <relationshipLabel>{relationship_label}</relationshipLabel>"
-                if relationship_name:
-                    type_def += f"\n                    <relationshipName>{relationship_name}</relationshipName>"
-            else:
-                if f_type == "Picklist":
-                    f_picklist_values = field["picklist_values"]
-                    picklist_values_str = ""
-                    for picklist_value in f_picklist_values:
-                        val = f"""<value>
-                                    <fullName>{picklist_value}</fullName>
+def _render_number_type(field):
+    return _NUMBER_TYPE_DEF
+
+def _render_checkbox_type(field):
+    default_val = field.get("defaultValue", False)
+    return f"<type>Checkbox</type>\n                    <defaultValue>{str(default_val).lower()}</defaultValue>"
+
+def _render_lookup_type(field):
+    parts = [f"<type>Lookup</type>\n                    <referenceTo>{field.get('referenceTo', '')}</referenceTo>"]
+    relationship_label = field.get("relationshipLabel", "")
+    relationship_name = field.get("relationshipName", "")
+    if relationship_label:
+        parts.append(f"\n                    <relationshipLabel>{relationship_label}</relationshipLabel>")
+    if relationship_name:
+        parts.append(f"\n                    <relationshipName>{relationship_name}</relationshipName>")
+    return "".join(parts)
+
+_PICKLIST_VALUE_TMPL = """<value>
+                                    <fullName>%s</fullName>
                                     <default>false</default>
-                                    <label>{picklist_value}</label>
+                                    <label>%s</label>
                                 </value>
                                 """
-                        picklist_values_str = picklist_values_str + val
 
-                    type_def = f"""
+def _render_picklist_type(field):
+    picklist_values_str = "".join(
+        _PICKLIST_VALUE_TMPL % (picklist_value, picklist_value)
+        for picklist_value in field["picklist_values"]
+    )
+    return f"""
                         <type>Picklist</type>
                         <valueSet>
                             <restricted>true</restricted>
@@ -312,72 +792,86 @@ def create_metadata_package(json_obj):
                             </valueSetDefinition>
                         </valueSet>
                         """
-                else:
-                    type_def = """<precision>18</precision>
-                        <scale>0</scale>
-                        <type>Number</type>"""
 
-            new_field = field_tmpl.replace("##api_name##", f_api_name)
-            new_field = new_field.replace("##name##", f_name)
-            new_field = new_field.replace("##type##", type_def)
-            fields_str = fields_str + new_field
-
-        # Update package.xml to include both object and profile
-        package_xml = """<?xml version="1.0" encoding="UTF-8"?>
-<Package xmlns="http://soap.sforce.com/2006/04/metadata">
-    <types>
-        <members>{api_name}</members>
-        <name>CustomObject</name>
-    </types>
-    <types>
-        <members>Admin</members>
-        <name>Profile</name>
-    </types>
-    <version>63.0</version>
-</Package>""".format(api_name=api_name)
-
-        with open(f"{BASE_PATH}/current/package.xml", "w", encoding="utf-8") as file:
-            file.write(package_xml)
-
-        obj_path = f"{BASE_PATH}/current/objects/{api_name}.object"
-
-        with open(obj_path, "r", encoding="utf-8") as file:
-            obj_tmpl = file.read()
+_FIELD_TYPE_RENDERERS = {
+    "Text": _render_text_type,
+    "URL": _render_url_type,
+    "Checkbox": _render_checkbox_type,
+    "Lookup": _render_lookup_type,
+    "Picklist": _render_picklist_type,
+}
 
-        if description is None:
-            description = ""
+def deploy_many(sf, package_dirs):
+    """Deploys several staged package directories concurrently.
+
+    At most DEPLOY_CONCURRENCY submissions are in flight at once.
+
+    Returns:
+        list: {"jobId": ...} per directory, in order, or the exception that directory raised.
+    """
+    def deploy_one(package_dir):
+        try:
+            return deploy(zip_directory(package_dir), sf)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=DEPLOY_CONCURRENCY) as pool:
+        return list(pool.map(deploy_one, package_dirs))
 
-        obj_tmpl = obj_tmpl.replace("##description##", description)
-        obj_tmpl = obj_tmpl.replace("##name##", name)
-        obj_tmpl = obj_tmpl.replace("##plural_name##", plural_name)
-        obj_tmpl = obj_tmpl.replace("##fields##", fields_str)
+def create_metadata_package(json_obj, dest_dir=None):
+    """Creates a metadata package for custom object creation with fields.
 
-        with open(obj_path, "w", encoding="utf-8") as file:
-            file.write(obj_tmpl)
+    The package is staged in dest_dir, by default the shared current/ directory.
+    """
+    if dest_dir is None:
+        dest_dir = f"{BASE_PATH}/current"
+    try:
+        name = json_obj["name"]
+        plural_name = json_obj["plural_name"]
+        description = json_obj["description"]
+        api_name = json_obj["api_name"]
+        fields = json_obj["fields"]
 
-        # Create profiles directory in the deployment package
-        profiles_dir = os.path.join(f"{BASE_PATH}/current", "profiles")
-        os.makedirs(profiles_dir, exist_ok=True)
+        shutil.rmtree(dest_dir, ignore_errors=True)
+
+        field_tmpl = _load_template("field.tmpl")
+
+        fields_parts = []
+        field_names = []
+
+        for field in fields:
+            f_api_name = field["api_name"]
+            field_names.append(f_api_name)
+
+            type_def = _FIELD_TYPE_RENDERERS.get(field["type"], _render_number_type)(field)
+            new_field = field_tmpl.safe_substitute(api_name=f_api_name, name=field["label"], type=type_def)
+            fields_parts.append(new_field)
+
+        fields_str = "".join(fields_parts)
+
+        if description is None:
+            description = ""
 
         # Create field permissions XML
-        field_permissions = ""
-        for field in field_names:
-            field_permissions += f"""    <fieldPermissions>
+        field_permissions = "".join(
+            f"""    <fieldPermissions>
         <editable>true</editable>
         <field>{api_name}.{field}</field>
         <readable>true</readable>
     </fieldPermissions>
 """
+            for field in field_names
+        )
 
-        # Create profile XML using template
-        with open(os.path.join(BASE_PATH, "assets", "profile.tmpl"), "r", encoding="utf-8") as f:
-            profile_template = f.read()
-
-        profile_xml = profile_template.replace("##fieldPermissions##", field_permissions)
-
-        # Write profile XML
-        with open(os.path.join(profiles_dir, "Admin.profile"), "w", encoding="utf-8") as f:
-            f.write(profile_xml)
+        _render_package(dest_dir, OBJECT_PACKAGE_MANIFEST, {
+            "api_name": api_name,
+            "name": name,
+            "plural_name": plural_name,
+            "description": description,
+            "fields": fields_str,
+            "fieldPermissions": field_permissions,
+            "tabVisibilities": "",
+        })
 
     except Exception as e:
         err_msg = f"An error occurred: {e}"
@@ -404,79 +898,40 @@ def create_einstein_model_package(json_obj):
         # Create template name (sanitized)
         template_name = model_name.replace(" ", "_").replace("-", "_")
         
-        # Copy Einstein model template structure
-        source_template = os.path.join(BASE_PATH, "assets", "create_einstein_model_tmpl", "appTemplates", "##template_name##")
         deploy_dir = os.path.join(BASE_PATH, DEPLOY_DIR)
         target_template_dir = os.path.join(deploy_dir, "appTemplates", template_name)
-        
-        # Create directory structure
+
+        # Static bundle files are copied as-is; only the contents, not metadata, matter
         os.makedirs(target_template_dir, exist_ok=True)
-        
-        # Copy and process template files
-        shutil.copytree(source_template, target_template_dir, dirs_exist_ok=True)
-        
-        # Process ModelContainer.json
-        container_path = os.path.join(target_template_dir, "ml", "containers", "ModelContainer.json")
-        with open(container_path, "r", encoding="utf-8") as f:
-            container_content = f.read()
-        
-        container_content = container_content.replace("##model_label##", model_name)
-        container_content = container_content.replace("##model_description##", description)
-        container_content = container_content.replace("##model_capability##", model_capability)
-        container_content = container_content.replace("##outcome_field##", outcome_field)
-        container_content = container_content.replace("##goal##", goal)
-        
-        with open(container_path, "w", encoding="utf-8") as f:
-            f.write(container_content)
-        
-        # Process ModelSetup.json with fields
-        setup_path = os.path.join(target_template_dir, "ml", "setups", "ModelSetup.json")
-        with open(setup_path, "r", encoding="utf-8") as f:
-            setup_content = f.read()
-        
+        for static_file in EINSTEIN_STATIC_FILES:
+            shutil.copyfile(
+                os.path.join(BASE_PATH, "assets", EINSTEIN_TEMPLATE_DIR, static_file),
+                os.path.join(target_template_dir, static_file),
+            )
+
         # Build fields JSON
         fields_json = build_einstein_fields_json(fields, outcome_field)
         
         # Determine outcome type based on model capability
         outcome_type = "Binary" if model_capability == "BinaryClassification" else "Regression"
-        
-        setup_content = setup_content.replace("##setup_description##", f"{description} - Model Setup")
-        setup_content = setup_content.replace("##data_source##", data_source)
-        setup_content = setup_content.replace("##outcome_type##", outcome_type)
-        setup_content = setup_content.replace("##failure_value##", failure_value)
-        setup_content = setup_content.replace("##goal##", goal)
-        setup_content = setup_content.replace("##outcome_label##", outcome_field.replace("_", " ").replace("__c", ""))
-        setup_content = setup_content.replace("##outcome_field##", outcome_field)
-        setup_content = setup_content.replace("##success_value##", success_value)
-        setup_content = setup_content.replace("##algorithm_type##", algorithm_type)
-        setup_content = setup_content.replace("##fields_json##", fields_json)
-        
-        with open(setup_path, "w", encoding="utf-8") as f:
-            f.write(setup_content)
-        
-        # Process template-info.json
-        template_info_path = os.path.join(target_template_dir, "template-info.json")
-        with open(template_info_path, "r", encoding="utf-8") as f:
-            template_info_content = f.read()
-        
-        template_info_content = template_info_content.replace("##model_label##", model_name)
-        template_info_content = template_info_content.replace("##template_description##", f"{description} - Einstein Studio Model Template")
-        template_info_content = template_info_content.replace("##template_name##", template_name)
-        
-        with open(template_info_path, "w", encoding="utf-8") as f:
-            f.write(template_info_content)
-        
-        # Create package.xml for AppFrameworkTemplateBundle
-        source_package = os.path.join(BASE_PATH, "assets", "create_einstein_model_tmpl", "package.xml")
-        target_package = os.path.join(deploy_dir, "package.xml")
-        
-        with open(source_package, "r", encoding="utf-8") as f:
-            package_content = f.read()
-        
-        package_content = package_content.replace("##template_name##", template_name)
-        
-        with open(target_package, "w", encoding="utf-8") as f:
-            f.write(package_content)
+
+        _render_package(deploy_dir, EINSTEIN_PACKAGE_MANIFEST, {
+            "template_name": template_name,
+            "model_label": model_name,
+            "model_description": description,
+            "model_capability": model_capability,
+            "template_description": f"{description} - Einstein Studio Model Template",
+            "setup_description": f"{description} - Model Setup",
+            "data_source": data_source,
+            "outcome_type": outcome_type,
+            "outcome_label": outcome_field.replace("_", " ").replace("__c", ""),
+            "outcome_field": outcome_field,
+            "goal": goal,
+            "success_value": success_value,
+            "failure_value": failure_value,
+            "algorithm_type": algorithm_type,
+            "fields_json": fields_json,
+        })
         
         write_to_file(f"Einstein Studio model package created: {template_name}")
         
@@ -568,31 +1023,16 @@ def build_einstein_fields_json(fields, outcome_field):
             
             fields_array.append(field_obj)
         
-        return json.dumps(fields_array, indent=4)
+        return orjson.dumps(fields_array, option=orjson.OPT_INDENT_2).decode()
         
     except Exception as e:
         raise Exception(f"Error building fields JSON: {e}")
 
-def deploy_package_from_deploy_dir(sf):
+def deploy_package_from_deploy_dir(sf, force=False):
     """Zips the DEPLOY_DIR and deploys it via the Metadata API."""
     deploy_dir_path = os.path.join(BASE_PATH, DEPLOY_DIR)
     if not os.path.exists(deploy_dir_path):
         raise FileNotFoundError(f"Deployment directory not found: {deploy_dir_path}")
 
     # Zip only the contents of the deployment directory (no parent folder)
-    zip_path = os.path.join(BASE_PATH, "deploy_package.zip")
-    # Remove old zip if present
-    if os.path.exists(zip_path):
-        os.remove(zip_path)
-    # Create new zip with contents at the root
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for root, dirs, files in os.walk(deploy_dir_path):
-            for file in files:
-                abs_file = os.path.join(root, file)
-                # Compute path relative to deploy_dir_path
-                rel_path = os.path.relpath(abs_file, deploy_dir_path)
-                zf.write(abs_file, rel_path)
-
-    # Encode and deploy
-    b64 = binary_to_base64(zip_path)
-    deploy(b64, sf)
\ No newline at end of file
+    return _deploy_directory(deploy_dir_path, sf, force)
@@ -4,38 +4,205 @@ HTTP API wrapper for Salesforce MCP server.
 Exposes MCP tools as REST API endpoints for ChatGPT and web usage.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import APIRouter, FastAPI, Header, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List, Dict, Any
 from contextlib import asynccontextmanager
+from cachetools import TTLCache
 import os
-import json
+import re
+import orjson
+import asyncio
+import hashlib
+import importlib.util
+import sys
+import anyio
 import uvicorn
 
 # Import your existing MCP components
 from salesforcemcp import sfdc_client
-from salesforcemcp import implementations as sfmcpimpl
+
+def _lazy_import(name: str):
+    """Imports a module whose body only runs on first attribute access."""
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+# The tool implementations (and the MCP types they pull in) load on the first API call,
+# so the server starts answering health checks sooner
+sfmcpimpl = _lazy_import("salesforcemcp.implementations")
+
+# Worker threads available to the blocking Salesforce calls behind /api/*
+THREADPOOL_SIZE = 128
 
 # Initialize Salesforce client globally
 sf_client = sfdc_client.OrgHandler()
 
+# Recent SOQL responses keyed by (org instance, canonical query); send X-No-Cache to bypass
+_soql_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_SOQL_LITERAL_RE = re.compile(r"('(?:[^'\\]|\\.)*')")
+_WHITESPACE_RE = re.compile(r"\s+")
+# Only keywords are folded: aliases keep their case in the result keys, so identifiers stay as written
+_SOQL_KEYWORD_RE = re.compile(
+    r"\b(?:and|asc|by|desc|excludes|false|first|from|group|having|in|includes|last|like|limit|"
+    r"not|null|nulls|offset|or|order|select|true|where|with)\b",
+    re.IGNORECASE,
+)
+
+def _canonical_soql(query: str) -> str:
+    """Normalizes keyword case and whitespace outside string literals, which SOQL ignores."""
+    parts = _SOQL_LITERAL_RE.split(query.strip().rstrip(";").strip())
+    for i in range(0, len(parts), 2):
+        parts[i] = _SOQL_KEYWORD_RE.sub(lambda m: m.group().lower(), _WHITESPACE_RE.sub(" ", parts[i]))
+    return "".join(parts)
+
+# How long the first queued SOQL query waits for others to share its Composite Batch request
+SOQL_BATCH_WINDOW = 0.01
+
+class SoqlCoalescer:
+    """Dispatches SOQL queries that arrive within SOQL_BATCH_WINDOW as one Composite Batch call."""
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._batches: set[asyncio.Task] = set()
+
+    async def submit(self, query: str) -> list:
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((query, future))
+        return await future
+
+    async def run(self):
+        while True:
+            batch = [await self.queue.get()]
+            # Let queries issued in the same tick join; only wait out the window while
+            # other batches are in flight, so a lone query is sent straight away
+            await asyncio.sleep(SOQL_BATCH_WINDOW if self._batches else 0)
+            while len(batch) < sfdc_client.COMPOSITE_BATCH_SIZE and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            # Batches run concurrently; the next window opens while this one is in flight
+            task = asyncio.create_task(self._dispatch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _dispatch(self, batch: list):
+        loop = asyncio.get_running_loop()
+
+        def resolve(index: int, result: list):
+            future = batch[index][1]
+            if not future.done():
+                future.set_result(result)
+
+        def on_result(index: int, result: list):
+            # Called from worker threads as each query completes
+            loop.call_soon_threadsafe(resolve, index, result)
+
+        try:
+            await run_in_threadpool(
+                sfmcpimpl.run_soql_queries_impl, sf_client, [query for query, _ in batch], on_result
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        # A worker that died before on_result would leave its caller waiting forever
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(RuntimeError("query did not complete"))
+
+_soql_coalescer: Optional[SoqlCoalescer] = None
+
+# Static responses serialized once; the OpenAPI document is filled in at startup,
+# after every route has been registered
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "service": "Salesforce MCP API"})
+_ROOT_BYTES = orjson.dumps({
+    "message": "Salesforce MCP API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "health": "/health",
+    "openapi": "/openapi.json",
+    "manifest": "/.well-known/ai-plugin.json"
+})
+_MANIFEST_BYTES = orjson.dumps({
+    "schema_version": "v1",
+    "name_for_human": "Salesforce MCP API",
+    "name_for_model": "salesforce_mcp",
+    "description_for_human": "Access Salesforce data, create objects, and manage Einstein models",
+    "description_for_model": "API for Salesforce operations including SOQL queries, object creation, and Einstein Studio models",
+    "auth": {
+        "type": "none"
+    },
+    "api": {
+        "type": "openapi",
+        "url": "https://salesforce-mcp-claude-production.up.railway.app/openapi.json"
+    },
+    "logo_url": "https://salesforce-mcp-claude-production.up.railway.app/logo.png",
+    "contact_email": "support@example.com",
+    "legal_info_url": "https://salesforce-mcp-claude-production.up.railway.app/legal"
+})
+_OPENAPI_BYTES = b""
+
+# Validators for the static documents, so clients and proxies can revalidate with a 304
+STATIC_CACHE_CONTROL = "public, max-age=300"
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak If-None-Match comparison: any listed tag equal to etag, or "*"."""
+    if not etag:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+def _static_json(request: Request, body: bytes, etag: str) -> Response:
+    headers = {"ETag": etag, "Cache-Control": STATIC_CACHE_CONTROL} if etag else {}
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+_MANIFEST_ETAG = _etag(_MANIFEST_BYTES)
+_OPENAPI_ETAG = ""
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize Salesforce connection on startup"""
+    global _OPENAPI_BYTES, _OPENAPI_ETAG, _soql_coalescer
     print("Starting up Salesforce MCP API...")
-    if not sf_client.establish_connection():
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    _OPENAPI_BYTES = orjson.dumps(app.openapi())
+    _OPENAPI_ETAG = _etag(_OPENAPI_BYTES)
+    if not await sf_client.ensure_connection():
         print("Warning: Failed to establish Salesforce connection")
     else:
         print("✅ Salesforce connection established")
+    _soql_coalescer = SoqlCoalescer()
+    coalescer_task = asyncio.create_task(_soql_coalescer.run())
     yield
     print("Shutting down Salesforce MCP API...")
+    coalescer_task.cancel()
 
 app = FastAPI(
     title="Salesforce MCP API",
     description="REST API for Salesforce operations including object creation, data querying, and Einstein Studio models",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    # Served below from the pre-serialized document instead of FastAPI's per-request handler
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None
 )
 
 # Add CORS middleware for ChatGPT integration
@@ -47,202 +214,188 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Query and describe results are large, highly repetitive JSON
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Static documents answered on the event loop, kept apart from the /api/* routes that
+# wait on Salesforce in the threadpool
+fast_router = APIRouter()
+slow_router = APIRouter()
+
 # Health check endpoint for Railway
-@app.get("/health")
+@fast_router.get("/health")
 async def health_check():
     """Health check endpoint for Railway deployment"""
-    return {"status": "healthy", "service": "Salesforce MCP API"}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
-@app.get("/")
-@app.post("/")  
+@fast_router.get("/")
+@fast_router.post("/")  
 async def root():
     """Root endpoint with API information - handles both GET and POST"""
-    return {
-        "message": "Salesforce MCP API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "health": "/health",
-        "openapi": "/openapi.json",
-        "manifest": "/.well-known/ai-plugin.json"
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 # Manifest endpoint for ChatGPT Actions
-@app.get("/.well-known/ai-plugin.json")
-async def get_manifest():
+@fast_router.get("/.well-known/ai-plugin.json")
+async def get_manifest(request: Request):
     """Manifest for ChatGPT plugin integration"""
-    return {
-        "schema_version": "v1",
-        "name_for_human": "Salesforce MCP API",
-        "name_for_model": "salesforce_mcp",
-        "description_for_human": "Access Salesforce data, create objects, and manage Einstein models",
-        "description_for_model": "API for Salesforce operations including SOQL queries, object creation, and Einstein Studio models",
-        "auth": {
-            "type": "none"
-        },
-        "api": {
-            "type": "openapi",
-            "url": "https://salesforce-mcp-claude-production.up.railway.app/openapi.json"
-        },
-        "logo_url": "https://salesforce-mcp-claude-production.up.railway.app/logo.png",
-        "contact_email": "support@example.com",
-        "legal_info_url": "https://salesforce-mcp-claude-production.up.railway.app/legal"
-    }
-
-# OpenAPI spec endpoint (alternative path)
-@app.get("/openapi.json")
-async def get_openapi():
+    return _static_json(request, _MANIFEST_BYTES, _MANIFEST_ETAG)
+
+# OpenAPI spec endpoint
+@fast_router.get("/openapi.json", include_in_schema=False)
+async def get_openapi(request: Request):
     """Get OpenAPI specification"""
-    return app.openapi()
+    return _static_json(request, _OPENAPI_BYTES, _OPENAPI_ETAG)
+
+@fast_router.get("/docs", include_in_schema=False)
+async def swagger_ui():
+    return get_swagger_ui_html(openapi_url="/openapi.json", title=f"{app.title} - Swagger UI")
+
+@fast_router.get("/redoc", include_in_schema=False)
+async def redoc():
+    return get_redoc_html(openapi_url="/openapi.json", title=f"{app.title} - ReDoc")
 
 # Request/Response models
-class CreateObjectRequest(BaseModel):
+class RequestModel(BaseModel):
+    """Base for request bodies: strict JSON types, unknown keys rejected, validated values immutable."""
+    model_config = ConfigDict(strict=True, extra="forbid", frozen=True, str_strip_whitespace=True)
+
+class CreateObjectRequest(RequestModel):
     name: str
     plural_name: str
     api_name: str
     description: Optional[str] = None
 
-class FieldDefinition(BaseModel):
+class FieldDefinition(RequestModel):
     type: str
     label: str
     api_name: str
     picklist_values: Optional[List[str]] = None
+    # Type-specific settings read by the Checkbox and Lookup field renderers
+    defaultValue: Optional[bool] = None
+    referenceTo: Optional[str] = None
+    relationshipLabel: Optional[str] = None
+    relationshipName: Optional[str] = None
 
-class CreateObjectWithFieldsRequest(BaseModel):
+class ObjectDefinition(RequestModel):
     name: str
     plural_name: str
     api_name: str
     description: str
     fields: List[FieldDefinition]
 
-class SOQLQueryRequest(BaseModel):
+class CreateObjectWithFieldsRequest(ObjectDefinition):
+    force: bool = False
+
+class CreateObjectsBulkRequest(RequestModel):
+    objects: List[ObjectDefinition]
+
+class PollDeployStatusRequest(RequestModel):
+    job_id: str
+
+class SOQLQueryRequest(RequestModel):
     query: str
 
-class SOSLSearchRequest(BaseModel):
+class SOSLSearchRequest(RequestModel):
     search: str
 
-class GetObjectFieldsRequest(BaseModel):
+class GetObjectFieldsRequest(RequestModel):
     object_name: str
 
-class DescribeObjectRequest(BaseModel):
+class DescribeObjectRequest(RequestModel):
     object_name: str
-    include_field_details: Optional[bool] = True
+    include_field_details: bool = True
 
-class ModelField(BaseModel):
+class ModelField(RequestModel):
     field_name: str
     field_label: str
     field_type: str
     data_type: str
-    ignored: Optional[bool] = False
+    ignored: bool = False
 
-class CreateEinsteinModelRequest(BaseModel):
+class CreateEinsteinModelRequest(RequestModel):
     model_name: str
     description: str
-    model_capability: Optional[str] = "BinaryClassification"
+    model_capability: str = "BinaryClassification"
     outcome_field: str
-    goal: Optional[str] = "Maximize"
+    goal: str = "Maximize"
     data_source: str
-    success_value: Optional[str] = "true"
-    failure_value: Optional[str] = "false"
-    algorithm_type: Optional[str] = "XGBoost"
+    success_value: str = "true"
+    failure_value: str = "false"
+    algorithm_type: str = "XGBoost"
     fields: List[ModelField]
+    force: bool = False
 
 # API Endpoints
-@app.post("/api/create-object")
-async def create_object(request: CreateObjectRequest):
-    """Create a new custom object in Salesforce"""
-    try:
-        arguments = {
-            "name": request.name,
-            "plural_name": request.plural_name,
-            "api_name": request.api_name,
-            "description": request.description or f"Custom object: {request.name}"
-        }
-        result = sfmcpimpl.create_object_impl(sf_client, arguments)
-        return {"success": True, "result": [r.text for r in result]}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.post("/api/create-object-with-fields")
-async def create_object_with_fields(request: CreateObjectWithFieldsRequest):
-    """Create a new custom object with fields in Salesforce"""
-    try:
-        arguments = {
-            "name": request.name,
-            "plural_name": request.plural_name,
-            "api_name": request.api_name,
-            "description": request.description,
-            "fields": [field.dict() for field in request.fields]
-        }
-        result = sfmcpimpl.create_object_with_fields_impl(sf_client, arguments)
-        return {"success": True, "result": [r.text for r in result]}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-@app.post("/api/soql-query")
-async def run_soql_query(request: SOQLQueryRequest):
-    """Execute a SOQL query against Salesforce"""
-    try:
-        arguments = {"query": request.query}
-        result = sfmcpimpl.run_soql_query_impl(sf_client, arguments)
-        return {"success": True, "result": [r.text for r in result]}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+# (path, handler name, request model, impl attribute, docstring) for endpoints that pass
+# the validated body straight to their impl; the handler name fixes the OpenAPI operationId
+_ENDPOINTS = (
+    ("/api/create-object", "create_object", CreateObjectRequest,
+     "create_object_impl", "Create a new custom object in Salesforce"),
+    ("/api/create-object-with-fields", "create_object_with_fields", CreateObjectWithFieldsRequest,
+     "create_object_with_fields_impl", "Create a new custom object with fields in Salesforce"),
+    ("/api/create-objects-bulk", "create_objects_bulk", CreateObjectsBulkRequest,
+     "create_objects_bulk_impl", "Create several custom objects with fields, deploying them in parallel"),
+    ("/api/poll-deploy-status", "poll_deploy_status", PollDeployStatusRequest,
+     "poll_deploy_status_impl", "Check the progress of a metadata deployment"),
+    ("/api/sosl-search", "run_sosl_search", SOSLSearchRequest,
+     "run_sosl_search_impl", "Execute a SOSL search against Salesforce"),
+    ("/api/get-object-fields", "get_object_fields", GetObjectFieldsRequest,
+     "get_object_fields_impl", "Get detailed field information for a Salesforce object"),
+    ("/api/describe-object", "describe_object", DescribeObjectRequest,
+     "describe_object_impl", "Get comprehensive schema information for a Salesforce object"),
+    ("/api/create-einstein-model", "create_einstein_model", CreateEinsteinModelRequest,
+     "create_einstein_model_impl", "Create an Einstein Studio predictive model"),
+)
 
-@app.post("/api/sosl-search")
-async def run_sosl_search(request: SOSLSearchRequest):
-    """Execute a SOSL search against Salesforce"""
-    try:
-        arguments = {"search": request.search}
-        result = sfmcpimpl.run_sosl_search_impl(sf_client, arguments)
-        return {"success": True, "result": [r.text for r in result]}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+def _make_handler(name: str, model: type[RequestModel], impl_name: str, doc: str):
+    async def handler(request: model):
+        try:
+            await sf_client.ensure_connection()
+            # Resolved per call so the lazily imported implementations load on first use
+            impl = getattr(sfmcpimpl, impl_name)
+            # Unset optionals are left out so the impls fall back to their own defaults
+            result = await run_in_threadpool(impl, sf_client, request.model_dump(exclude_none=True))
+            return ORJSONResponse({"success": True, "result": tuple(r.text for r in result)})
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+    handler.__name__ = handler.__qualname__ = name
+    handler.__doc__ = doc
+    return handler
 
-@app.post("/api/get-object-fields")
-async def get_object_fields(request: GetObjectFieldsRequest):
-    """Get detailed field information for a Salesforce object"""
-    try:
-        arguments = {"object_name": request.object_name}
-        result = sfmcpimpl.get_object_fields_impl(sf_client, arguments)
-        return {"success": True, "result": [r.text for r in result]}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+for path, name, model, impl_name, doc in _ENDPOINTS:
+    slow_router.post(path)(_make_handler(name, model, impl_name, doc))
 
-@app.post("/api/describe-object")
-async def describe_object(request: DescribeObjectRequest):
-    """Get comprehensive schema information for a Salesforce object"""
+@slow_router.post("/api/soql-query")
+async def run_soql_query(request: SOQLQueryRequest, x_no_cache: Optional[str] = Header(None)):
+    """Execute a SOQL query against Salesforce"""
     try:
-        arguments = {
-            "object_name": request.object_name,
-            "include_field_details": request.include_field_details
-        }
-        result = sfmcpimpl.describe_object_impl(sf_client, arguments)
-        return {"success": True, "result": [r.text for r in result]}
+        await sf_client.ensure_connection()
+        cache_key = None
+        if sf_client.connection and not x_no_cache:
+            cache_key = (sf_client.connection.sf_instance, _canonical_soql(request.query))
+            cached = _soql_cache.get(cache_key)
+            if cached is not None:
+                return ORJSONResponse({"success": True, "result": cached, "cached": True})
+        if _soql_coalescer is not None and request.query:
+            result = await _soql_coalescer.submit(request.query)
+        else:
+            arguments = {"query": request.query}
+            result = await run_in_threadpool(sfmcpimpl.run_soql_query_impl, sf_client, arguments)
+        texts = tuple(r.text for r in result)
+        # Errors come back as text too; only query results are worth replaying
+        if cache_key is not None and texts and texts[0].startswith("SOQL Query Results"):
+            _soql_cache[cache_key] = texts
+        return ORJSONResponse({"success": True, "result": texts})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/api/create-einstein-model")
-async def create_einstein_model(request: CreateEinsteinModelRequest):
-    """Create an Einstein Studio predictive model"""
-    try:
-        arguments = {
-            "model_name": request.model_name,
-            "description": request.description,
-            "model_capability": request.model_capability,
-            "outcome_field": request.outcome_field,
-            "goal": request.goal,
-            "data_source": request.data_source,
-            "success_value": request.success_value,
-            "failure_value": request.failure_value,
-            "algorithm_type": request.algorithm_type,
-            "fields": [field.dict() for field in request.fields]
-        }
-        result = sfmcpimpl.create_einstein_model_impl(sf_client, arguments)
-        return {"success": True, "result": [r.text for r in result]}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+app.include_router(fast_router)
+app.include_router(slow_router)
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # Workers are forked processes, so the app has to be passed as an import string
+    workers = int(os.environ.get("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1))
+    uvicorn.run("web_server:app", host="0.0.0.0", port=port, workers=workers, loop="uvloop", http="httptools",
+                access_log=False)